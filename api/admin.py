@@ -5,7 +5,7 @@ from django.urls import reverse
 from django import forms
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 import nested_admin
 import os
 import json
@@ -583,11 +583,19 @@ class UserAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate active-subscription status so the list doesn't query it per row"""
+        return super().get_queryset(request).annotate(
+            has_active_subscription_annotated=Exists(
+                Subscription.objects.filter(user=OuterRef('pk'), status='active')
+            )
+        )
+    
     def subscription_status(self, obj):
         """Display subscription status in list view"""
         if obj.is_premium:
             return format_html('<span style="color: green;">✓ Premium</span>')
-        elif obj.has_active_subscription:
+        elif obj.has_active_subscription_annotated:
             return format_html('<span style="color: orange;">⚠ Active Sub</span>')
         else:
             return format_html('<span style="color: gray;">Free</span>')
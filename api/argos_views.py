@@ -243,8 +243,9 @@ def argos_tests_run(request):
         try:
             # Run Django tests
             # Note: This runs all tests - you might want to specify a test suite
+            # Uses in-memory SQLite test settings so runs never touch the production database
             result = subprocess.run(
-                ['python', 'manage.py', 'test', '--verbosity=0', '--no-input'],
+                ['python', 'manage.py', 'test', '--settings=satlingo.settings_test', '--verbosity=0', '--no-input'],
                 capture_output=True,
                 text=True,
                 timeout=300,  # 5 minutes
@@ -0,0 +1,54 @@
+"""
+Custom DRF authentication.
+
+Location: api/authentication.py
+Summary: JWT authentication that loads the user with their effective premium status annotated.
+Usage: Configured in settings.REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'];
+       read through is_premium_user() in api/views.py.
+"""
+from django.db.models import BooleanField, Case, Exists, OuterRef, Value, When
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import Subscription
+
+
+class PremiumJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication whose user lookup also resolves premium access.
+
+    The user row is fetched with is_premium_effective annotated (is_premium, or
+    else an EXISTS over active subscriptions), so premium checks don't need a
+    second has_active_subscription query. The token checks mirror
+    JWTAuthentication.get_user.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        users = self.user_model.objects.annotate(
+            is_premium_effective=Case(
+                When(is_premium=True, then=Value(True)),
+                default=Exists(Subscription.objects.filter(user=OuterRef('pk'), status='active')),
+                output_field=BooleanField(),
+            )
+        )
+        try:
+            user = users.get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
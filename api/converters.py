@@ -0,0 +1,45 @@
+"""
+Custom URL path converters for API routes.
+
+Location: api/converters.py
+Summary: Typed converters for the UUID primary keys used in progress/answers/admin routes,
+         plus parse_uuid() for UUIDs that arrive in request bodies.
+Usage: Registered in api/urls.py via register_converter().
+"""
+import re
+import uuid
+
+UUID_PATTERN = '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+UUID_RE = re.compile(r'\A%s\Z' % UUID_PATTERN)
+
+
+def parse_uuid(value):
+    """
+    Return value as a uuid.UUID, or None if it isn't a hyphenated UUID string.
+
+    Body-supplied IDs (question_id, passage_id, ...) are checked with a regex
+    match instead of try/except around uuid.UUID(), so malformed input from
+    bots or old clients is rejected without raising.
+    """
+    if isinstance(value, uuid.UUID):
+        return value
+    if isinstance(value, str) and UUID_RE.match(value):
+        return uuid.UUID(value)
+    return None
+
+
+class HexUUIDConverter:
+    """
+    Match a UUID path segment in either case (iOS sends uppercase UUIDs).
+
+    Django's built-in <uuid:...> converter only accepts lowercase hex, so this
+    keeps the old case-insensitive behaviour while still rejecting malformed
+    IDs at resolve time instead of inside every view.
+    """
+    regex = UUID_PATTERN
+
+    def to_python(self, value):
+        return uuid.UUID(value)
+
+    def to_url(self, value):
+        return str(value)
@@ -0,0 +1,123 @@
+"""
+Management command to pre-generate upcoming words of the day.
+Fills in every date in the next --days days that has no WordOfTheDay yet, generating
+the words concurrently so WordOfTheDayView never has to call OpenAI on a request.
+
+With --batch the words are requested through the OpenAI Batch API instead (half the
+cost, done within 24h); rerun with --collect <batch id> to store the results.
+
+Run daily (e.g. Heroku Scheduler) with --bank so the word is always ready before the
+day starts and the bank covers any gap, keeping OpenAI off the request path:
+    python manage.py generate_words_of_the_day --days 7 --bank 14
+"""
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import WordOfTheDay
+from api.word_gpt_utils import (
+    bank_words, collect_word_batch, count_banked_words, dedupe_words, generate_words, get_known_words,
+    submit_word_batch,
+)
+
+
+class Command(BaseCommand):
+    help = 'Pre-generate words of the day for upcoming dates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Number of days, starting today, to fill in (default: 7)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show which dates would be filled without generating anything',
+        )
+        parser.add_argument(
+            '--batch',
+            action='store_true',
+            help='Submit an OpenAI Batch API job instead of generating now',
+        )
+        parser.add_argument(
+            '--bank',
+            type=int,
+            default=0,
+            help='Also keep at least this many unused words banked for WordOfTheDayView (default: 0)',
+        )
+        parser.add_argument(
+            '--collect',
+            type=str,
+            default=None,
+            metavar='BATCH_ID',
+            help='Store the words from a finished --batch job',
+        )
+
+    def handle(self, *args, **options):
+        today = date.today()
+        dates = [today + timedelta(days=i) for i in range(options['days'])]
+        existing = set(WordOfTheDay.objects.filter(date__in=dates).values_list('date', flat=True))
+        missing = [d for d in dates if d not in existing]
+        bank_shortfall = max(options['bank'] - count_banked_words(), 0)
+        needed = len(missing) + bank_shortfall
+
+        if not needed and not options['collect']:
+            self.stdout.write('Every date already has a word and the bank is full.')
+            return
+        if options['dry_run']:
+            for d in missing:
+                self.stdout.write(f'Would generate a word for {d}')
+            if bank_shortfall:
+                self.stdout.write(f'Would bank {bank_shortfall} more word(s)')
+            return
+
+        if options['batch']:
+            # Ask for a few spares: duplicates and failed requests are dropped on collect
+            batch_id = submit_word_batch(needed * 2)
+            self.stdout.write(self.style.SUCCESS(
+                f'Submitted batch {batch_id}; run with --collect {batch_id} once it completes'
+            ))
+            return
+
+        if options['collect']:
+            try:
+                words = collect_word_batch(options['collect'])
+            except Exception as e:
+                raise CommandError(str(e))
+            if words is None:
+                self.stdout.write(self.style.WARNING(f'Batch {options["collect"]} is still running'))
+                return
+        else:
+            words = generate_words(needed)
+
+        self.store_words(missing, words)
+
+    def store_words(self, missing, words):
+        """Assign words to the missing dates in order, skipping words already known, and bank the rest"""
+        # Skip repeats within the batch and (case-insensitively) past or banked words
+        words = dedupe_words(words, get_known_words(words))
+        created = 0
+        spare = []
+        for word_data in words:
+            if not missing:
+                spare.append(word_data)
+                continue
+            WordOfTheDay.objects.create(
+                date=missing.pop(0),
+                word=word_data['word'],
+                definition=word_data['definition'],
+                synonyms=word_data['synonyms'],
+                example_sentence=word_data['example_sentence'],
+            )
+            created += 1
+
+        # Extras (e.g. a batch's spares) are banked for WordOfTheDayView to use later
+        bank_words(spare)
+
+        self.stdout.write(self.style.SUCCESS(f'Created {created} word(s) of the day, banked {len(spare)}'))
+        if missing:
+            self.stdout.write(self.style.WARNING(
+                f'{len(missing)} date(s) still without a word; run the command again to retry'
+            ))
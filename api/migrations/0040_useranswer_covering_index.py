@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0039_add_password_reset_token'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='useranswer',
+            name='user_answer_user_id_157974_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='useranswer',
+            name='user_answer_user_id_963ecb_idx',
+        ),
+        migrations.AddIndex(
+            model_name='useranswer',
+            index=models.Index(fields=['user', 'question'], include=('selected_option_index', 'is_correct'), name='ua_user_q_covering_idx'),
+        ),
+    ]
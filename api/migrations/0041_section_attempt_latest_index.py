@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0040_useranswer_covering_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='mathsectionattempt',
+            name='math_sectio_user_id_dbf5b0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='writingsectionattempt',
+            name='writing_sec_user_id_97e760_idx',
+        ),
+        migrations.AddIndex(
+            model_name='mathsectionattempt',
+            index=models.Index(fields=['user', 'math_section', '-completed_at'], name='msa_user_sect_comp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='writingsectionattempt',
+            index=models.Index(fields=['user', 'writing_section', '-completed_at'], name='wsa_user_sect_comp_idx'),
+        ),
+    ]
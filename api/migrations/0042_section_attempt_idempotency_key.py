@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-18 04:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0041_section_attempt_latest_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mathsectionattempt',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Client Idempotency-Key header of the submit that created this attempt', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='writingsectionattempt',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Client Idempotency-Key header of the submit that created this attempt', max_length=64, null=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='mathsectionattempt',
+            unique_together={('user', 'math_section', 'idempotency_key')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='writingsectionattempt',
+            unique_together={('user', 'writing_section', 'idempotency_key')},
+        ),
+    ]
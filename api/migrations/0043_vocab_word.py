@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:10
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0042_section_attempt_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VocabWord',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('word', models.CharField(max_length=100, unique=True)),
+                ('definition', models.TextField()),
+                ('synonyms', models.JSONField(default=list)),
+                ('example_sentence', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'vocab_words',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='vocab_words_created_324a99_idx')],
+            },
+        ),
+    ]
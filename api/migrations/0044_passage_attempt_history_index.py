@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 05:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0043_vocab_word'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='passageattempt',
+            name='passage_att_user_id_fca787_idx',
+        ),
+        migrations.AddIndex(
+            model_name='passageattempt',
+            index=models.Index(fields=['user', 'passage', '-completed_at'], name='pa_user_pass_comp_idx'),
+        ),
+    ]
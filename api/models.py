@@ -1,10 +1,11 @@
 import uuid
 import logging
 import threading
-from datetime import timedelta
+from datetime import date, timedelta
 from django.db import models
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
+from django.core.cache import cache
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator, RegexValidator, URLValidator
 from django.core.exceptions import ValidationError as DjangoValidationError
@@ -83,6 +84,18 @@ class Passage(models.Model):
         return self.title
 
 
+# Cache key for the total passage count shown on /progress (see ProgressView)
+PASSAGE_COUNT_CACHE_KEY = 'passage_count_v1'
+
+
+@receiver(post_save, sender=Passage)
+@receiver(post_delete, sender=Passage)
+def invalidate_passage_count(sender, instance, **kwargs):
+    """Drop the cached passage count when passages are added or removed"""
+    if kwargs.get('created', True):
+        cache.delete(PASSAGE_COUNT_CACHE_KEY)
+
+
 class PassageAnnotation(models.Model):
     """
     Annotations for specific text selections in passages.
@@ -378,7 +391,9 @@ class PassageAttempt(models.Model):
     class Meta:
         db_table = 'passage_attempts'
         indexes = [
-            models.Index(fields=['user', 'passage']),
+            # Serves the attempts history and list summaries as an index-ordered
+            # scan; also covers (user, passage) lookups
+            models.Index(fields=['user', 'passage', '-completed_at'], name='pa_user_pass_comp_idx'),
             models.Index(fields=['user']),
             models.Index(fields=['passage']),
             models.Index(fields=['completed_at']),
@@ -402,10 +417,16 @@ class UserAnswer(models.Model):
     class Meta:
         db_table = 'user_answers'
         indexes = [
-            models.Index(fields=['user', 'question']),
-            models.Index(fields=['user']),
             models.Index(fields=['question']),
             models.Index(fields=['answered_at']),
+            # Covering index for the per-passage answer lookups in review/annotations,
+            # which also serves plain (user, question) lookups
+            # (INCLUDE columns are PostgreSQL-only; other backends get a plain index)
+            models.Index(
+                fields=['user', 'question'],
+                include=['selected_option_index', 'is_correct'],
+                name='ua_user_q_covering_idx',
+            ),
         ]
         # Removed unique_together to allow multiple attempts per question
     
@@ -435,6 +456,44 @@ class WordOfTheDay(models.Model):
         return f"{self.word} - {self.date}"
 
 
+# Cache key (per date) for the serialized word of the day (see WordOfTheDayView)
+WORD_OF_THE_DAY_CACHE_KEY = 'wotd:%s'
+
+
+@receiver(post_save, sender=WordOfTheDay)
+@receiver(post_delete, sender=WordOfTheDay)
+def invalidate_word_of_the_day(sender, instance, **kwargs):
+    """Drop the cached payload when a day's word is edited in admin or removed"""
+    # Today's key too, in case the word was moved off today's date
+    dates = {instance.date, date.today()}
+    cache.delete_many([WORD_OF_THE_DAY_CACHE_KEY % day.isoformat() for day in dates])
+
+
+class VocabWord(models.Model):
+    """
+    Generated SAT words not yet assigned to a day.
+
+    Spare words from bulk generation (generate_words_of_the_day) are banked
+    here, and WordOfTheDayView takes the oldest one before calling OpenAI.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    word = models.CharField(max_length=100, unique=True)
+    definition = models.TextField()
+    synonyms = models.JSONField(default=list)  # List of synonym strings
+    example_sentence = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'vocab_words'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
+    
+    def __str__(self):
+        return self.word
+
+
 class PassageIngestion(models.Model):
     """Track passage ingestion from files/screenshots"""
     STATUS_CHOICES = [
@@ -944,16 +1003,21 @@ class WritingSectionAttempt(models.Model):
     completed_at = models.DateTimeField(auto_now_add=True)
     # Store answers as JSON for full history
     answers_data = models.JSONField(default=list)  # List of {question_id, selected_option_index, is_correct, etc.}
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True, help_text="Client Idempotency-Key header of the submit that created this attempt")
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = 'writing_section_attempts'
         indexes = [
-            models.Index(fields=['user', 'writing_section']),
+            # Serves the latest-attempt lookup (review) and the attempts history
+            # as an index-ordered scan; also covers (user, writing_section) lookups
+            models.Index(fields=['user', 'writing_section', '-completed_at'], name='wsa_user_sect_comp_idx'),
             models.Index(fields=['user']),
             models.Index(fields=['writing_section']),
             models.Index(fields=['completed_at']),
         ]
+        # A replayed submit (same Idempotency-Key) resolves to the attempt it already created
+        unique_together = [['user', 'writing_section', 'idempotency_key']]
         ordering = ['-completed_at']
     
     def __str__(self):
@@ -1251,16 +1315,21 @@ class MathSectionAttempt(models.Model):
     completed_at = models.DateTimeField(auto_now_add=True)
     # Store answers as JSON for full history
     answers_data = models.JSONField(default=list)  # List of {question_id, selected_option_index, is_correct, etc.}
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True, help_text="Client Idempotency-Key header of the submit that created this attempt")
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         db_table = 'math_section_attempts'
         indexes = [
-            models.Index(fields=['user', 'math_section']),
+            # Serves the latest-attempt lookup (review) and the attempts history
+            # as an index-ordered scan; also covers (user, math_section) lookups
+            models.Index(fields=['user', 'math_section', '-completed_at'], name='msa_user_sect_comp_idx'),
             models.Index(fields=['user']),
             models.Index(fields=['math_section']),
             models.Index(fields=['completed_at']),
         ]
+        # A replayed submit (same Idempotency-Key) resolves to the attempt it already created
+        unique_together = [['user', 'math_section', 'idempotency_key']]
         ordering = ['-completed_at']
     
     def __str__(self):
@@ -0,0 +1,48 @@
+"""
+Custom DRF paginators.
+
+Location: api/pagination.py
+Summary: LimitOffsetPagination that caches the listing's total count for a short TTL.
+Usage: Set as pagination_class on the content list viewsets (lessons, writing/math sections).
+"""
+import hashlib
+
+from django.core.cache import cache
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class CachedCountLimitOffsetPagination(LimitOffsetPagination):
+    """
+    LimitOffsetPagination whose COUNT(*) is cached per view and filter set.
+
+    Content listings change rarely but are paged through often, so the total
+    is reused for count_cache_timeout seconds instead of being recounted on
+    every page. The key covers the view, every query param except limit/offset
+    and, for tier=premium, the requester's premium flag.
+    """
+    count_cache_timeout = 30
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_count_cache_key(self):
+        # Imported here: views imports this module for pagination_class
+        from .views import is_premium_user
+
+        params = sorted(
+            (key, value) for key, value in self.request.query_params.lists()
+            if key not in (self.limit_query_param, self.offset_query_param)
+        )
+        # Only tier=premium listings differ by user, so only they pay for the premium check
+        premium = self.request.query_params.get('tier') == 'premium' and is_premium_user(self.request)
+        key = repr((getattr(self.view, 'basename', None), params, premium))
+        return 'list-count:%s' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def get_count(self, queryset):
+        # values('pk') keeps the annotated list columns out of the COUNT query
+        return cache.get_or_set(
+            self.get_count_cache_key(),
+            lambda: queryset.order_by().values('pk').count(),
+            self.count_cache_timeout,
+        )
@@ -0,0 +1,36 @@
+"""
+Custom DRF renderers.
+
+Location: api/renderers.py
+Summary: orjson-backed JSON renderer used as the default API renderer.
+Usage: Configured in settings.REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# UTC datetimes render as '...Z' to match DRF's JSONEncoder output
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer that serializes with orjson.
+
+    UUIDs, dates and datetimes are handled natively by orjson; anything else
+    (Decimal, lazy strings, querysets) falls back to DRF's JSONEncoder.default
+    so responses stay byte-compatible with the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            # Pretty-printed output (browsable API / ?indent=) keeps the stdlib path
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+
+        # Match JSONRenderer: escape U+2028/U+2029 so output is a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
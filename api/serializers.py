@@ -1,3 +1,6 @@
+import copy
+from functools import lru_cache
+
 from rest_framework import serializers
 from .models import (
     Passage, Question, QuestionOption, User, UserSession,
@@ -7,15 +10,77 @@ from .models import (
     MathSection, MathQuestion, MathQuestionOption, MathAsset, MathQuestionAsset, MathSectionAttempt,
     Header, QuestionClassification
 )
+from .constants import DEFAULT_COLORS, DEFAULT_ICONS, DEFAULT_FALLBACK_COLOR
+
+
+@lru_cache(maxsize=4096)
+def effective_visuals(icon_url, color, category):
+    """
+    Return (effective_icon_url, effective_color) for a content item.
+    Falls back to the category defaults; a pure function of its arguments,
+    so results are memoized per process across list responses.
+    """
+    return (
+        icon_url or DEFAULT_ICONS.get(category),
+        color or DEFAULT_COLORS.get(category, DEFAULT_FALLBACK_COLOR),
+    )
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its field set once per class.
+
+    ModelSerializer.get_fields() introspects the model and deep-copies the
+    declared fields on every instantiation, although the result depends only
+    on the class. Build it once and hand each instance its own copies: plain
+    fields are shallow-copied (bind() only sets attributes on the copy),
+    nested serializers are deep-copied so their children bind to the new parent.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        fields = self._fields_cache.get(type(self))
+        if fields is None:
+            fields = self._fields_cache[type(self)] = super().get_fields()
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in fields.items()
+        }
+
+
+def get_page_attempts(serializer, obj):
+    """
+    The user's attempts on obj as loaded for the whole page by
+    ConditionalListMixin (newest first), or None when the serializer is used
+    without them and has to query per object.
+    """
+    page_attempts = serializer.context.get('page_attempts')
+    if page_attempts is None:
+        return None
+    return page_attempts.get(obj.pk, [])
+
+
+def summarize_section_attempts(attempts):
+    """attempt_summary for writing/math section listings from page-loaded attempts"""
+    if not attempts:
+        return None
+    return {
+        'best_score': max(attempt['score'] for attempt in attempts),
+        'latest_score': attempts[0]['score'],
+        'recent_attempts': [
+            {key: attempt[key] for key in ('score', 'correct_count', 'total_questions', 'completed_at')}
+            for attempt in attempts[:3]
+        ],
+    }
 
 
-class QuestionOptionSerializer(serializers.ModelSerializer):
+class QuestionOptionSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = QuestionOption
         fields = ['id', 'text', 'order']
 
 
-class QuestionSerializer(serializers.ModelSerializer):
+class QuestionSerializer(CachedFieldsModelSerializer):
     options = QuestionOptionSerializer(many=True, read_only=True)
     options_list = serializers.SerializerMethodField()
     
@@ -26,10 +91,11 @@ class QuestionSerializer(serializers.ModelSerializer):
     
     def get_options_list(self, obj):
         """Return options as a simple list of strings for API compatibility"""
-        return [opt.text for opt in obj.options.all().order_by('order')]
+        # options is ordered by Meta.ordering; an explicit order_by() would bypass a prefetch
+        return [opt.text for opt in obj.options.all()]
 
 
-class QuestionListSerializer(serializers.ModelSerializer):
+class QuestionListSerializer(CachedFieldsModelSerializer):
     """Serializer for questions without correct answers (but includes explanations)"""
     options = serializers.SerializerMethodField()
     
@@ -39,19 +105,21 @@ class QuestionListSerializer(serializers.ModelSerializer):
     
     def get_options(self, obj):
         """Return options as a simple list of strings"""
-        return [opt.text for opt in obj.options.all().order_by('order')]
+        # options is ordered by Meta.ordering; an explicit order_by() would bypass a prefetch
+        return [opt.text for opt in obj.options.all()]
 
 
-class PassageAnnotationSerializer(serializers.ModelSerializer):
+class PassageAnnotationSerializer(CachedFieldsModelSerializer):
     """Serializer for passage annotations"""
-    question_id = serializers.UUIDField(source='question.id', read_only=True, allow_null=True)
+    # Read off the FK column so rendering never has to load the question row
+    question_id = serializers.UUIDField(read_only=True, allow_null=True)
     
     class Meta:
         model = PassageAnnotation
         fields = ['id', 'question_id', 'start_char', 'end_char', 'selected_text', 'explanation', 'order']
 
 
-class HeaderSerializer(serializers.ModelSerializer):
+class HeaderSerializer(CachedFieldsModelSerializer):
     """Serializer for headers"""
     effective_icon_url = serializers.SerializerMethodField()
     effective_background_color = serializers.SerializerMethodField()
@@ -66,20 +134,14 @@ class HeaderSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get(obj.category)
+        return effective_visuals(obj.icon_url, obj.background_color, obj.category)[0]
 
     def get_effective_background_color(self, obj):
         """Return background_color or category-based default"""
-        if obj.background_color:
-            return obj.background_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get(obj.category, DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.background_color, obj.category)[1]
 
 
-class PassageListSerializer(serializers.ModelSerializer):
+class PassageListSerializer(CachedFieldsModelSerializer):
     header = HeaderSerializer(read_only=True)
     question_count = serializers.SerializerMethodField()
     attempt_count = serializers.SerializerMethodField()
@@ -100,23 +162,23 @@ class PassageListSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('reading')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'reading')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('reading', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'reading')[1]
     
     def get_question_count(self, obj):
+        # PassageViewSet annotates question_count; only count per row without it
+        if hasattr(obj, 'question_count'):
+            return obj.question_count
         return obj.questions.count()
     
     def get_attempt_count(self, obj):
         """Get number of attempts for the current user"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            return len(attempts)
         request = self.context.get('request')
         if request:
             # Use the same method as views to get user (supports JWT)
@@ -129,6 +191,16 @@ class PassageListSerializer(serializers.ModelSerializer):
     
     def get_attempt_summary(self, obj):
         """Get summary of attempts (best score, latest score, recent attempts)"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            if not attempts:
+                return None
+            return {
+                'total_attempts': len(attempts),
+                'best_score': max(attempt['score'] for attempt in attempts),
+                'latest_score': attempts[0]['score'],
+                'recent_attempts': attempts[:3],
+            }
         request = self.context.get('request')
         if request:
             # Use the same method as views to get user (supports JWT)
@@ -136,7 +208,8 @@ class PassageListSerializer(serializers.ModelSerializer):
             user = get_user_from_request(request)
             if user:
                 from .models import PassageAttempt
-                attempts = PassageAttempt.objects.filter(user=user, passage=obj).order_by('-completed_at')
+                # Summaries only read scores; skip the per-answer answers_data blob
+                attempts = PassageAttempt.objects.filter(user=user, passage=obj).defer('answers_data').order_by('-completed_at')
                 count = attempts.count()
                 
                 if count == 0:
@@ -158,7 +231,7 @@ class PassageListSerializer(serializers.ModelSerializer):
         return None
 
 
-class PassageDetailSerializer(serializers.ModelSerializer):
+class PassageDetailSerializer(CachedFieldsModelSerializer):
     questions = QuestionSerializer(many=True, read_only=True)
     annotations = PassageAnnotationSerializer(many=True, read_only=True)
     effective_icon_url = serializers.SerializerMethodField()
@@ -172,17 +245,11 @@ class PassageDetailSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('reading')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'reading')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('reading', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'reading')[1]
 
 
 class UserProgressSerializer(serializers.ModelSerializer):
@@ -203,7 +270,7 @@ class UserProgressSummarySerializer(serializers.Serializer):
 
 
 class UserAnswerSerializer(serializers.ModelSerializer):
-    question_id = serializers.UUIDField(source='question.id', read_only=True)
+    question_id = serializers.UUIDField(read_only=True)
     annotations = serializers.SerializerMethodField()  # Annotations for this question
     
     class Meta:
@@ -380,19 +447,16 @@ class LessonListSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get(obj.lesson_type)
+        return effective_visuals(obj.icon_url, obj.icon_color, obj.lesson_type)[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get(obj.lesson_type, DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, obj.lesson_type)[1]
 
     def get_question_count(self, obj):
+        # LessonViewSet annotates question_count; only count per row without it
+        if hasattr(obj, 'question_count'):
+            return obj.question_count
         return obj.questions.count()
 
 
@@ -410,17 +474,11 @@ class LessonDetailSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get(obj.lesson_type)
+        return effective_visuals(obj.icon_url, obj.icon_color, obj.lesson_type)[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get(obj.lesson_type, DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, obj.lesson_type)[1]
 
 
 # Writing Section Serializers
@@ -467,26 +525,28 @@ class WritingSectionListSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('writing')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'writing')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('writing', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'writing')[1]
 
     def get_question_count(self, obj):
+        # WritingSectionViewSet annotates the counts; only count per row without them
+        if hasattr(obj, 'question_count'):
+            return obj.question_count
         return obj.questions.count()
 
     def get_selection_count(self, obj):
+        if hasattr(obj, 'selection_count'):
+            return obj.selection_count
         return obj.selections.count()
     
     def get_attempt_count(self, obj):
         """Get number of attempts for the current user"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            return len(attempts)
         request = self.context.get('request')
         if request:
             from .views import get_user_from_request
@@ -498,13 +558,16 @@ class WritingSectionListSerializer(serializers.ModelSerializer):
     
     def get_attempt_summary(self, obj):
         """Get summary of attempts (best score, latest score, recent attempts)"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            return summarize_section_attempts(attempts)
         request = self.context.get('request')
         if request:
             from .views import get_user_from_request
             user = get_user_from_request(request)
             if user:
                 from .models import WritingSectionAttempt
-                attempts = WritingSectionAttempt.objects.filter(user=user, writing_section=obj).order_by('-completed_at')
+                attempts = WritingSectionAttempt.objects.filter(user=user, writing_section=obj).defer('answers_data').order_by('-completed_at')
                 if attempts.exists():
                     best_attempt = attempts.order_by('-score', '-completed_at').first()
                     latest_attempt = attempts.first()
@@ -531,17 +594,11 @@ class WritingSectionDetailSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('writing')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'writing')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('writing', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'writing')[1]
 
 
 class SubmitWritingSectionRequestSerializer(serializers.Serializer):
@@ -605,7 +662,8 @@ class MathQuestionSerializer(serializers.ModelSerializer):
     
     def get_choices(self, obj):
         """Return options as a simple list of strings for API compatibility"""
-        return [opt.text for opt in obj.options.all().order_by('order')]
+        # options is ordered by Meta.ordering; an explicit order_by() would bypass a prefetch
+        return [opt.text for opt in obj.options.all()]
     
     def get_assets(self, obj):
         """Return assets (diagrams) associated with this question"""
@@ -638,26 +696,28 @@ class MathSectionListSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('math')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'math')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('math', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'math')[1]
 
     def get_question_count(self, obj):
+        # MathSectionViewSet annotates the counts; only count per row without them
+        if hasattr(obj, 'question_count'):
+            return obj.question_count
         return obj.questions.count()
 
     def get_asset_count(self, obj):
+        if hasattr(obj, 'asset_count'):
+            return obj.asset_count
         return obj.assets.count()
     
     def get_attempt_count(self, obj):
         """Get number of attempts for the current user"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            return len(attempts)
         request = self.context.get('request')
         if request:
             from .views import get_user_from_request
@@ -668,12 +728,15 @@ class MathSectionListSerializer(serializers.ModelSerializer):
     
     def get_attempt_summary(self, obj):
         """Get summary of attempts (best score, latest score, recent attempts)"""
+        attempts = get_page_attempts(self, obj)
+        if attempts is not None:
+            return summarize_section_attempts(attempts)
         request = self.context.get('request')
         if request:
             from .views import get_user_from_request
             user = get_user_from_request(request)
             if user:
-                attempts = MathSectionAttempt.objects.filter(user=user, math_section=obj).order_by('-completed_at')
+                attempts = MathSectionAttempt.objects.filter(user=user, math_section=obj).defer('answers_data').order_by('-completed_at')
                 if attempts.exists():
                     best_attempt = attempts.order_by('-score', '-completed_at').first()
                     latest_attempt = attempts.first()
@@ -705,17 +768,11 @@ class MathSectionDetailSerializer(serializers.ModelSerializer):
 
     def get_effective_icon_url(self, obj):
         """Return icon_url or category-based default (may be None if no default exists)"""
-        if obj.icon_url:
-            return obj.icon_url
-        from api.constants import DEFAULT_ICONS
-        return DEFAULT_ICONS.get('math')
+        return effective_visuals(obj.icon_url, obj.icon_color, 'math')[0]
 
     def get_effective_icon_color(self, obj):
         """Return icon_color or category-based default"""
-        if obj.icon_color:
-            return obj.icon_color
-        from api.constants import DEFAULT_COLORS, DEFAULT_FALLBACK_COLOR
-        return DEFAULT_COLORS.get('math', DEFAULT_FALLBACK_COLOR)
+        return effective_visuals(obj.icon_url, obj.icon_color, 'math')[1]
 
 
 class QuestionClassificationSerializer(serializers.ModelSerializer):
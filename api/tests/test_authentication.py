@@ -0,0 +1,71 @@
+"""
+Unit tests for JWT authentication.
+
+Location: api/tests/test_authentication.py
+Coverage: PremiumJWTAuthentication's premium annotation and token checks.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from api.authentication import PremiumJWTAuthentication
+from api.models import Lesson, Subscription, User
+
+
+def bearer(user):
+    """Authorization header kwargs for a fresh access token for user"""
+    return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+
+class PremiumJWTAuthenticationTests(TestCase):
+    """Tests for PremiumJWTAuthentication.get_user()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.free_user = User.objects.create_user(username='free', email='free@example.com', password='pw')
+        cls.subscriber = User.objects.create_user(username='subscriber', email='subscriber@example.com', password='pw')
+        Subscription.objects.create(
+            user=cls.subscriber,
+            stripe_subscription_id='sub_test',
+            status='active',
+            current_period_start=timezone.now(),
+            current_period_end=timezone.now() + timedelta(days=30),
+        )
+        cls.premium_lesson = Lesson.objects.create(lesson_id='premium-lesson', title='Premium', tier='premium')
+
+    def test_user_is_loaded_with_effective_premium_status(self):
+        """is_premium_effective reflects an active subscription, in one query."""
+        authentication = PremiumJWTAuthentication()
+        for user, expected in [(self.free_user, False), (self.subscriber, True)]:
+            with self.subTest(user=user.email), self.assertNumQueries(1):
+                loaded = authentication.get_user(AccessToken.for_user(user))
+            self.assertEqual(loaded.is_premium_effective, expected)
+
+    def test_premium_content_follows_the_annotation(self):
+        """A subscriber can open premium content; a free user gets 403."""
+        url = reverse('lesson-detail', args=[self.premium_lesson.id])
+
+        self.assertEqual(self.client.get(url, **bearer(self.subscriber)).status_code, 200)
+        self.assertEqual(self.client.get(url, **bearer(self.free_user)).status_code, 403)
+
+    def test_token_is_revoked_by_password_change(self):
+        """With CHECK_REVOKE_TOKEN on, a token issued before a password change is rejected."""
+        user = User.objects.create_user(username='changer', email='changer@example.com', password='pw')
+        token = AccessToken.for_user(user)
+        token[api_settings.REVOKE_TOKEN_CLAIM] = get_md5_hash_password(user.password)
+        authentication = PremiumJWTAuthentication()
+
+        with patch('api.authentication.api_settings.CHECK_REVOKE_TOKEN', True):
+            self.assertEqual(authentication.get_user(token), user)
+            user.set_password('new-pw')
+            user.save()
+            with self.assertRaises(AuthenticationFailed):
+                authentication.get_user(token)
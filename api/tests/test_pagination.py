@@ -0,0 +1,44 @@
+"""
+Unit tests for custom pagination.
+
+Location: api/tests/test_pagination.py
+Coverage: CachedCountLimitOffsetPagination's cached total count and its cache key.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from api.models import Lesson
+
+
+class CachedCountLimitOffsetPaginationTests(TestCase):
+    """Tests for the cached count on GET /lessons."""
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('lesson-list')
+        for i in range(3):
+            Lesson.objects.create(lesson_id=f'lesson-{i}', title=f'Lesson {i}', difficulty='Easy')
+
+    def get_count(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['count']
+
+    def test_count_is_reused_across_pages(self):
+        """Later pages of the same listing reuse the cached total instead of recounting."""
+        self.assertEqual(self.get_count(limit=1), 3)
+
+        Lesson.objects.create(lesson_id='lesson-new', title='New lesson', difficulty='Easy')
+        self.assertEqual(self.get_count(limit=1, offset=1), 3)
+
+        cache.clear()
+        self.assertEqual(self.get_count(limit=1, offset=1), 4)
+
+    def test_count_is_cached_per_filter_set(self):
+        """Different filters get their own cached total."""
+        Lesson.objects.create(lesson_id='lesson-hard', title='Hard lesson', difficulty='Hard')
+
+        self.assertEqual(self.get_count(limit=1), 4)
+        self.assertEqual(self.get_count(limit=1, difficulty='Hard'), 1)
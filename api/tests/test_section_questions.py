@@ -0,0 +1,75 @@
+"""
+Unit tests for the section questions actions.
+
+Location: api/tests/test_section_questions.py
+Coverage: WritingSectionViewSet.questions and MathSectionViewSet.questions, which build
+          their rows by hand, match the question serializers they replaced.
+"""
+
+import orjson
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from api.models import (
+    MathAsset, MathQuestion, MathQuestionAsset, MathQuestionOption, MathSection,
+    WritingSection, WritingSectionQuestion, WritingSectionQuestionOption,
+)
+from api.serializers import MathQuestionSerializer, WritingSectionQuestionSerializer
+
+
+def rendered(data):
+    """data as the API would put it on the wire (UUIDs as strings)"""
+    return orjson.loads(JSONRenderer().render(data))
+
+
+class SectionQuestionsShapeTests(TestCase):
+    """The questions actions return exactly what the serializers would."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writing_section = WritingSection.objects.create(
+            title='Writing', content='Content', difficulty='Easy', tier='free'
+        )
+        for order, selection_number in [(2, None), (1, 3)]:
+            question = WritingSectionQuestion.objects.create(
+                writing_section=cls.writing_section, text=f'Question {order}', correct_answer_index=1,
+                explanation='Because', order=order, selection_number=selection_number,
+            )
+            for option_order in (1, 0):
+                WritingSectionQuestionOption.objects.create(
+                    question=question, text=f'Option {option_order}', order=option_order
+                )
+
+        cls.math_section = MathSection.objects.create(
+            section_id='math-shape', title='Math', difficulty='Medium', tier='free'
+        )
+        asset = MathAsset.objects.create(
+            math_section=cls.math_section, asset_id='diagram-1', s3_url='https://example.com/diagram-1.png'
+        )
+        for order in (2, 1):
+            question = MathQuestion.objects.create(
+                math_section=cls.math_section, question_id=f'q{order}', order=order,
+                prompt=[{'type': 'paragraph', 'text': f'Prompt {order}'}],
+                explanation=[{'type': 'paragraph', 'text': 'Because'}],
+            )
+            for option_order in (1, 0):
+                MathQuestionOption.objects.create(question=question, text=f'{order}-{option_order}', order=option_order)
+            if order == 1:
+                MathQuestionAsset.objects.create(question=question, asset=asset)
+
+    def test_writing_questions_match_serializer(self):
+        """GET /writing-sections/:id/questions matches WritingSectionQuestionSerializer."""
+        response = self.client.get(reverse('writing-section-questions', args=[self.writing_section.id]))
+        self.assertEqual(response.status_code, 200)
+
+        expected = WritingSectionQuestionSerializer(self.writing_section.questions.order_by('order'), many=True).data
+        self.assertEqual(orjson.loads(response.content), {'questions': rendered(expected)})
+
+    def test_math_questions_match_serializer(self):
+        """GET /math-sections/:id/questions matches MathQuestionSerializer."""
+        response = self.client.get(reverse('math-section-questions', args=[self.math_section.id]))
+        self.assertEqual(response.status_code, 200)
+
+        expected = MathQuestionSerializer(self.math_section.questions.order_by('order'), many=True).data
+        self.assertEqual(orjson.loads(response.content), {'results': rendered(expected)})
@@ -0,0 +1,83 @@
+"""
+Unit tests for writing/math section submissions.
+
+Location: api/tests/test_section_submit.py
+Coverage: SectionSubmitView's Idempotency-Key handling.
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.models import User, WritingSection, WritingSectionAttempt, WritingSectionQuestion
+
+
+class SectionSubmitIdempotencyTests(TestCase):
+    """Tests for the Idempotency-Key header on POST /progress/writing-sections/:id/submit."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='submitter', email='submitter@example.com', password='pw')
+        cls.section = WritingSection.objects.create(title='Section', content='Content', difficulty='Easy', tier='free')
+        cls.questions = [
+            WritingSectionQuestion.objects.create(
+                writing_section=cls.section, text=f'Question {i}', correct_answer_index=0, order=i
+            )
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        self.url = reverse('progress-writing-submit', args=[self.section.id])
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(self.user).access_token}'}
+        self.payload = {
+            'answers': [{'question_id': str(q.id), 'selected_option_index': 0} for q in self.questions],
+            'time_spent_seconds': 30,
+        }
+
+    def submit(self, payload=None, **headers):
+        return self.client.post(
+            self.url, payload or self.payload, content_type='application/json', **self.auth, **headers
+        )
+
+    def answer(self, question):
+        return {'answers': [{'question_id': str(question.id), 'selected_option_index': 0}], 'time_spent_seconds': 10}
+
+    def test_replayed_key_returns_the_same_attempt(self):
+        """A second submit with the same Idempotency-Key returns the first attempt and creates no row."""
+        first = self.submit(HTTP_IDEMPOTENCY_KEY='submit-1')
+        second = self.submit(HTTP_IDEMPOTENCY_KEY='submit-1')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()['attempt_id'], first.json()['attempt_id'])
+        self.assertEqual(WritingSectionAttempt.objects.filter(user=self.user).count(), 1)
+
+    def test_replayed_final_submit_of_an_incremental_attempt_is_a_no_op(self):
+        """Replaying the submit that finalized an in-progress attempt returns it and creates no row."""
+        self.submit(self.answer(self.questions[0]), HTTP_IDEMPOTENCY_KEY='k1')
+        final = self.submit(self.answer(self.questions[1]), HTTP_IDEMPOTENCY_KEY='k2')
+        replay = self.submit(self.answer(self.questions[1]), HTTP_IDEMPOTENCY_KEY='k2')
+
+        self.assertEqual(replay.status_code, 200)
+        self.assertEqual(replay.json()['attempt_id'], final.json()['attempt_id'])
+        self.assertEqual(replay.json()['score'], final.json()['score'])
+        self.assertTrue(replay.json()['is_completed'])
+        self.assertEqual(WritingSectionAttempt.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(len(WritingSectionAttempt.objects.get(user=self.user).answers_data), 2)
+
+    def test_overlong_key_is_rejected(self):
+        """An Idempotency-Key over 64 characters gets a 400 and creates nothing."""
+        response = self.submit(HTTP_IDEMPOTENCY_KEY='k' * 65)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'BAD_REQUEST')
+        self.assertFalse(WritingSectionAttempt.objects.exists())
+
+    def test_submits_without_key_each_create_an_attempt(self):
+        """Without the header every completed submit is a new attempt, as before."""
+        first = self.submit()
+        second = self.submit()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertNotEqual(second.json()['attempt_id'], first.json()['attempt_id'])
+        self.assertEqual(WritingSectionAttempt.objects.filter(user=self.user).count(), 2)
@@ -7,11 +7,13 @@ Coverage: icon_url, icon_color, background_color fields, effective_* serializer
 """
 
 import uuid
-from django.test import TestCase, Client
+import orjson
+from unittest.mock import patch
+from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.urls import reverse
 
-from api.models import Header, Passage, Lesson, MathSection, WritingSection
+from api.models import Header, Passage, Lesson, MathSection, MathQuestion, Question, WritingSection
 from api.serializers import (
     HeaderSerializer,
     PassageListSerializer,
@@ -610,16 +612,19 @@ class EdgeCaseTests(TestCase):
         self.assertIsNone(data['effective_icon_url'])
 
 
+def _find_by_id(items, target_id):
+    """Return the item in an API list response whose id matches target_id, or None."""
+    return {item['id']: item for item in items}.get(str(target_id))
+
+
 class APIEndpointIntegrationTests(TestCase):
     """Integration tests for API endpoints including visual enhancement fields."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.client = Client()
-        self.api_base = '/api/v1'
-
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the class; each test rolls back to it."""
         # Create test passage
-        self.passage = Passage.objects.create(
+        cls.passage = Passage.objects.create(
             title='Test Passage',
             content='Test content for passage',
             difficulty='Medium',
@@ -629,7 +634,7 @@ class APIEndpointIntegrationTests(TestCase):
         )
 
         # Create test lesson
-        self.lesson = Lesson.objects.create(
+        cls.lesson = Lesson.objects.create(
             lesson_id='test-lesson-api',
             title='Test Lesson',
             lesson_type='writing',
@@ -641,7 +646,7 @@ class APIEndpointIntegrationTests(TestCase):
         )
 
         # Create test math section
-        self.math_section = MathSection.objects.create(
+        cls.math_section = MathSection.objects.create(
             section_id='test-math-api',
             title='Test Math Section',
             difficulty='Medium',
@@ -651,7 +656,7 @@ class APIEndpointIntegrationTests(TestCase):
         )
 
         # Create test writing section
-        self.writing_section = WritingSection.objects.create(
+        cls.writing_section = WritingSection.objects.create(
             title='Test Writing Section',
             content='Test writing content',
             difficulty='Hard',
@@ -660,119 +665,87 @@ class APIEndpointIntegrationTests(TestCase):
             icon_color='#CE82FF'
         )
 
-    def tearDown(self):
-        """Clean up test data."""
-        self.passage.delete()
-        self.lesson.delete()
-        self.math_section.delete()
-        self.writing_section.delete()
-
-    def test_passages_list_endpoint_includes_icon_fields(self):
-        """GET /api/v1/passages/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/passages/')
-        self.assertEqual(response.status_code, 200)
-
-        data = response.json()
-        # Find our test passage
-        passages = data.get('results', data) if isinstance(data, dict) else data
-        test_passage = next((p for p in passages if str(p['id']) == str(self.passage.id)), None)
-
-        if test_passage:
-            self.assertIn('icon_url', test_passage)
-            self.assertIn('icon_color', test_passage)
-            self.assertIn('effective_icon_url', test_passage)
-            self.assertIn('effective_icon_color', test_passage)
-            self.assertEqual(test_passage['icon_url'], self.passage.icon_url)
-            self.assertEqual(test_passage['icon_color'], self.passage.icon_color)
-
-    def test_passage_detail_endpoint_includes_icon_fields(self):
-        """GET /api/v1/passages/<id>/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/passages/{self.passage.id}/')
+    # (route basename, fixture attribute) for every content endpoint with icon fields
+    ICON_ENDPOINTS = [
+        ('passage', 'passage'),
+        ('lesson', 'lesson'),
+        ('math-section', 'math_section'),
+        ('writing-section', 'writing_section'),
+    ]
+    ICON_FIELDS = ['icon_url', 'icon_color', 'effective_icon_url', 'effective_icon_color']
+
+    def test_list_endpoints_include_icon_fields(self):
+        """GET /api/v1/<content>/ should include visual enhancement fields."""
+        for basename, attr in self.ICON_ENDPOINTS:
+            with self.subTest(endpoint=f'{basename}-list'):
+                obj = getattr(self, attr)
+                response = self.client.get(reverse(f'{basename}-list'))
+                self.assertEqual(response.status_code, 200)
+
+                data = orjson.loads(response.content)
+                items = data.get('results', data) if isinstance(data, dict) else data
+                item = _find_by_id(items, obj.id)
+
+                self.assertIsNotNone(item)
+                for field in self.ICON_FIELDS:
+                    self.assertIn(field, item)
+                self.assertEqual(item['icon_url'], obj.icon_url)
+                self.assertEqual(item['icon_color'], obj.icon_color)
+
+    def test_detail_endpoints_include_icon_fields(self):
+        """GET /api/v1/<content>/<id>/ should include visual enhancement fields."""
+        for basename, attr in self.ICON_ENDPOINTS:
+            with self.subTest(endpoint=f'{basename}-detail'):
+                response = self.client.get(reverse(f'{basename}-detail', args=[getattr(self, attr).id]))
+                self.assertEqual(response.status_code, 200)
+
+                data = orjson.loads(response.content)
+                for field in self.ICON_FIELDS:
+                    self.assertIn(field, data)
+
+    def test_passages_list_endpoint_supports_conditional_get(self):
+        """List endpoints should answer a matching If-None-Match with 304 until content changes."""
+        url = reverse('passage-list')
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.passage.icon_color = '#FF9600'
+        self.passage.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
         self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
 
-        data = response.json()
-        self.assertIn('icon_url', data)
-        self.assertIn('icon_color', data)
-        self.assertIn('effective_icon_url', data)
-        self.assertIn('effective_icon_color', data)
+    def test_passages_list_etag_changes_when_questions_change(self):
+        """Adding a question changes question_count without touching the passage row."""
+        url = reverse('passage-list')
+        etag = self.client.get(url)['ETag']
 
-    def test_lessons_list_endpoint_includes_icon_fields(self):
-        """GET /api/v1/lessons/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/lessons/')
+        Question.objects.create(passage=self.passage, text='New question', correct_answer_index=0, order=99)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
         self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
 
-        data = response.json()
-        lessons = data.get('results', data) if isinstance(data, dict) else data
-        test_lesson = next((l for l in lessons if str(l['id']) == str(self.lesson.id)), None)
+    def test_detail_endpoint_answers_304_without_serializing(self):
+        """A matching If-None-Match on a detail endpoint returns 304 before the serializer runs."""
+        url = reverse('math-section-detail', args=[self.math_section.id])
+        etag = self.client.get(url)['ETag']
 
-        if test_lesson:
-            self.assertIn('icon_url', test_lesson)
-            self.assertIn('icon_color', test_lesson)
-            self.assertIn('effective_icon_url', test_lesson)
-            self.assertIn('effective_icon_color', test_lesson)
+        with patch('api.views.MathSectionDetailSerializer') as serializer:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        serializer.assert_not_called()
 
-    def test_lesson_detail_endpoint_includes_icon_fields(self):
-        """GET /api/v1/lessons/<id>/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/lessons/{self.lesson.id}/')
-        self.assertEqual(response.status_code, 200)
+    def test_detail_etag_changes_when_questions_change(self):
+        """Adding a question changes the detail ETag without touching the section row."""
+        url = reverse('math-section-detail', args=[self.math_section.id])
+        etag = self.client.get(url)['ETag']
 
-        data = response.json()
-        self.assertIn('icon_url', data)
-        self.assertIn('icon_color', data)
-        self.assertIn('effective_icon_url', data)
-        self.assertIn('effective_icon_color', data)
-
-    def test_math_sections_list_endpoint_includes_icon_fields(self):
-        """GET /api/v1/math-sections/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/math-sections/')
+        MathQuestion.objects.create(math_section=self.math_section, question_id='q1', order=1)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
         self.assertEqual(response.status_code, 200)
-
-        data = response.json()
-        sections = data.get('results', data) if isinstance(data, dict) else data
-        test_section = next((s for s in sections if str(s['id']) == str(self.math_section.id)), None)
-
-        if test_section:
-            self.assertIn('icon_url', test_section)
-            self.assertIn('icon_color', test_section)
-            self.assertIn('effective_icon_url', test_section)
-            self.assertIn('effective_icon_color', test_section)
-
-    def test_math_section_detail_endpoint_includes_icon_fields(self):
-        """GET /api/v1/math-sections/<id>/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/math-sections/{self.math_section.id}/')
-        self.assertEqual(response.status_code, 200)
-
-        data = response.json()
-        self.assertIn('icon_url', data)
-        self.assertIn('icon_color', data)
-        self.assertIn('effective_icon_url', data)
-        self.assertIn('effective_icon_color', data)
-
-    def test_writing_sections_list_endpoint_includes_icon_fields(self):
-        """GET /api/v1/writing-sections/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/writing-sections/')
-        self.assertEqual(response.status_code, 200)
-
-        data = response.json()
-        sections = data.get('results', data) if isinstance(data, dict) else data
-        test_section = next((s for s in sections if str(s['id']) == str(self.writing_section.id)), None)
-
-        if test_section:
-            self.assertIn('icon_url', test_section)
-            self.assertIn('icon_color', test_section)
-            self.assertIn('effective_icon_url', test_section)
-            self.assertIn('effective_icon_color', test_section)
-
-    def test_writing_section_detail_endpoint_includes_icon_fields(self):
-        """GET /api/v1/writing-sections/<id>/ should include visual enhancement fields."""
-        response = self.client.get(f'{self.api_base}/writing-sections/{self.writing_section.id}/')
-        self.assertEqual(response.status_code, 200)
-
-        data = response.json()
-        self.assertIn('icon_url', data)
-        self.assertIn('icon_color', data)
-        self.assertIn('effective_icon_url', data)
-        self.assertIn('effective_icon_color', data)
+        self.assertNotEqual(response['ETag'], etag)
 
     def test_effective_fields_computed_correctly_in_api(self):
         """effective_* fields should be computed correctly in API responses."""
@@ -786,13 +759,11 @@ class APIEndpointIntegrationTests(TestCase):
             icon_color=None
         )
 
-        response = self.client.get(f'{self.api_base}/passages/{passage_no_icon.id}/')
+        response = self.client.get(reverse('passage-detail', args=[passage_no_icon.id]))
         self.assertEqual(response.status_code, 200)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         # effective_icon_url should be None (no default)
         self.assertIsNone(data['effective_icon_url'])
         # effective_icon_color should be the default for reading
         self.assertEqual(data['effective_icon_color'], DEFAULT_COLORS.get('reading'))
-
-        passage_no_icon.delete()
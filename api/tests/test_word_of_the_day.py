@@ -0,0 +1,216 @@
+"""
+Unit tests for word of the day generation.
+
+Location: api/tests/test_word_of_the_day.py
+Coverage: generate_word() dedupe, caching and request-path retries, with the
+          OpenAI client mocked; get_fallback_word(); take_banked_word(); WordOfTheDayView's generation
+          lock and word bank; generate_words_of_the_day --bank.
+"""
+
+from datetime import date, timedelta
+from io import StringIO
+from unittest.mock import patch, MagicMock
+
+import orjson
+from openai import APIConnectionError
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from api.models import WORD_OF_THE_DAY_CACHE_KEY, VocabWord, WordOfTheDay
+from api.views import WordOfTheDayView
+from api.word_gpt_utils import (
+    FALLBACK_WORDS, WORD_REQUEST_ATTEMPTS, generate_word, get_fallback_word, take_banked_word,
+)
+
+
+def word_payload(word):
+    """A generated word record for word"""
+    return {
+        'word': word,
+        'definition': f'Definition of {word}',
+        'synonyms': ['One', 'Two'],
+        'example_sentence': f'A sentence using {word}.',
+    }
+
+
+def mock_openai_client(*words):
+    """An OpenAI client mock whose completions return the given words in order"""
+    client = MagicMock()
+    client.with_options.return_value = client
+    responses = []
+    for word in words:
+        response = MagicMock()
+        response.content = orjson.dumps({
+            'choices': [{'message': {'content': orjson.dumps(word_payload(word)).decode()}}],
+            'usage': {'prompt_tokens': 10, 'completion_tokens': 40},
+        })
+        responses.append(response)
+    client.chat.completions.with_raw_response.create.side_effect = responses
+    return client
+
+
+@override_settings(OPENAI_API_KEY='test-key')
+class GenerateWordTests(TestCase):
+    """Tests for generate_word()."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_new_word_is_returned_and_cached(self):
+        """A new word is returned and reused from the cache on the next call."""
+        client = mock_openai_client('Laconic')
+        with patch('api.word_gpt_utils.get_openai_client', return_value=client):
+            first = generate_word()
+            second = generate_word()
+
+        self.assertEqual(first['word'], 'Laconic')
+        self.assertEqual(second, first)
+        self.assertEqual(client.chat.completions.with_raw_response.create.call_count, 1)
+
+    def test_repeated_word_is_not_returned_or_cached(self):
+        """A word already used for a day falls back and is generated afresh next time."""
+        WordOfTheDay.objects.create(date=date.today() - timedelta(days=1), **word_payload('Laconic'))
+        client = mock_openai_client(' laconic', 'Lucid')
+        with patch('api.word_gpt_utils.get_openai_client', return_value=client):
+            first = generate_word()
+            second = generate_word()
+
+        self.assertEqual(first, get_fallback_word())
+        self.assertEqual(second['word'], 'Lucid')
+        self.assertEqual(client.chat.completions.with_raw_response.create.call_count, 2)
+
+    def test_transient_errors_get_a_short_retry_budget(self):
+        """The request path gives up after WORD_REQUEST_ATTEMPTS and serves the fallback."""
+        client = mock_openai_client()
+        client.chat.completions.with_raw_response.create.side_effect = APIConnectionError(request=MagicMock())
+        with patch('api.word_gpt_utils.get_openai_client', return_value=client), \
+                patch('api.word_gpt_utils.time.sleep') as sleep:
+            word_data = generate_word()
+
+        self.assertEqual(word_data, get_fallback_word())
+        self.assertEqual(client.chat.completions.with_raw_response.create.call_count, WORD_REQUEST_ATTEMPTS)
+        self.assertEqual(sleep.call_count, WORD_REQUEST_ATTEMPTS - 1)
+
+
+class FallbackWordTests(TestCase):
+    """Tests for get_fallback_word()."""
+
+    def setUp(self):
+        self.today = date.today()
+        self.start = self.today.toordinal() % len(FALLBACK_WORDS)
+
+    def test_rotates_by_date(self):
+        """With no curated word used yet, the entry is picked by date."""
+        self.assertEqual(get_fallback_word(self.today), FALLBACK_WORDS[self.start])
+
+    def test_skips_curated_words_already_used(self):
+        """A curated word that is already a day's word or banked is skipped for the next one."""
+        used = FALLBACK_WORDS[self.start]
+        WordOfTheDay.objects.create(date=self.today - timedelta(days=1), **dict(used, word=used['word'].lower()))
+        VocabWord.objects.create(**FALLBACK_WORDS[(self.start + 1) % len(FALLBACK_WORDS)])
+
+        self.assertEqual(get_fallback_word(self.today), FALLBACK_WORDS[(self.start + 2) % len(FALLBACK_WORDS)])
+
+    def test_none_once_every_curated_word_is_used(self):
+        """When the whole list has been used there is nothing safe to insert."""
+        WordOfTheDay.objects.bulk_create(
+            WordOfTheDay(date=self.today - timedelta(days=i + 1), **word_data)
+            for i, word_data in enumerate(FALLBACK_WORDS)
+        )
+        self.assertIsNone(get_fallback_word(self.today))
+
+
+class TakeBankedWordTests(TestCase):
+    """Tests for take_banked_word()."""
+
+    def test_oldest_banked_word_becomes_the_days_word(self):
+        """The oldest unused banked word is inserted for the day and removed from the bank."""
+        VocabWord.objects.create(**word_payload('Lucid'))
+        oldest = VocabWord.objects.create(**word_payload('Laconic'))
+        VocabWord.objects.filter(pk=oldest.pk).update(created_at=oldest.created_at - timedelta(days=1))
+
+        word_of_day = take_banked_word(date.today())
+
+        self.assertEqual(word_of_day.word, 'Laconic')
+        self.assertEqual(word_of_day.date, date.today())
+        self.assertEqual(list(VocabWord.objects.values_list('word', flat=True)), ['Lucid'])
+
+    def test_banked_word_is_kept_when_the_day_already_has_a_word(self):
+        """When another request created the day's row first, its word is returned and the bank is untouched."""
+        WordOfTheDay.objects.create(date=date.today(), **word_payload('Lucid'))
+        VocabWord.objects.create(**word_payload('Laconic'))
+
+        word_of_day = take_banked_word(date.today())
+
+        self.assertEqual(word_of_day.word, 'Lucid')
+        self.assertTrue(VocabWord.objects.filter(word='Laconic').exists())
+
+    def test_empty_bank_returns_none(self):
+        """With nothing banked, no row is created."""
+        self.assertIsNone(take_banked_word(date.today()))
+        self.assertFalse(WordOfTheDay.objects.exists())
+
+
+class WordOfTheDayViewTests(TestCase):
+    """Tests for GET /word-of-the-day when today has no word yet."""
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('word-of-the-day')
+        self.today = date.today()
+
+    def test_concurrent_request_serves_latest_word_without_waiting(self):
+        """While another request holds the generation lock, the latest stored word is returned at once."""
+        WordOfTheDay.objects.create(date=self.today - timedelta(days=1), **word_payload('Laconic'))
+        cache.add(WordOfTheDayView.generation_lock_key % self.today.isoformat(), 1)
+        with patch('api.views.generate_word') as generate:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['word'], 'Laconic')
+        generate.assert_not_called()
+        self.assertIsNone(cache.get(WORD_OF_THE_DAY_CACHE_KEY % self.today.isoformat()))
+
+    def test_banked_word_is_served_without_generating(self):
+        """With a banked word available, the view serves it and never calls OpenAI."""
+        VocabWord.objects.create(**word_payload('Laconic'))
+        with patch('api.views.generate_word') as generate:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['word'], 'Laconic')
+        generate.assert_not_called()
+        self.assertTrue(WordOfTheDay.objects.filter(date=self.today, word='Laconic').exists())
+        self.assertFalse(VocabWord.objects.exists())
+
+
+class GenerateWordsCommandTests(TestCase):
+    """Tests for the generate_words_of_the_day command's --bank option."""
+
+    def run_command(self, *args):
+        call_command('generate_words_of_the_day', *args, stdout=StringIO())
+
+    def test_fills_missing_days_and_banks_the_rest(self):
+        """Words go to the missing dates first; the extras fill the bank, skipping repeats."""
+        words = [word_payload(w) for w in ['Laconic', 'Lucid', 'lucid', 'Terse', 'Vivid']]
+        with patch('api.management.commands.generate_words_of_the_day.generate_words', return_value=words) as generate:
+            self.run_command('--days', '2', '--bank', '3')
+
+        generate.assert_called_once_with(5)
+        self.assertEqual(
+            list(WordOfTheDay.objects.order_by('date').values_list('word', flat=True)), ['Laconic', 'Lucid']
+        )
+        self.assertEqual(sorted(VocabWord.objects.values_list('word', flat=True)), ['Terse', 'Vivid'])
+
+    def test_only_the_bank_shortfall_is_generated(self):
+        """Banked words already on hand count toward --bank."""
+        WordOfTheDay.objects.create(date=date.today(), **word_payload('Laconic'))
+        VocabWord.objects.create(**word_payload('Lucid'))
+        with patch('api.management.commands.generate_words_of_the_day.generate_words',
+                   return_value=[word_payload('Terse')]) as generate:
+            self.run_command('--days', '1', '--bank', '2')
+
+        generate.assert_called_once_with(1)
+        self.assertEqual(sorted(VocabWord.objects.values_list('word', flat=True)), ['Lucid', 'Terse'])
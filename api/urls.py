@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path, include, register_converter
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenRefreshView
 from .views import (
@@ -26,8 +26,24 @@ from .appstore_views import (
 from .argos_views import (
     argos_health, argos_metrics, argos_tests_run, argos_tests_latest
 )
+from .converters import HexUUIDConverter
 
+register_converter(HexUUIDConverter, 'hexuuid')
+
+
+def progress_patterns(resource, id_kwarg, name_prefix, submit_view, review_view, attempts_view):
+    """Build the submit/review/attempts progress routes shared by every content type"""
+    route = f'{resource}/<hexuuid:{id_kwarg}>'
+    return [
+        path(f'{route}/submit', submit_view.as_view(), name=f'{name_prefix}-submit'),
+        path(f'{route}/review', review_view.as_view(), name=f'{name_prefix}-review'),
+        path(f'{route}/attempts', attempts_view.as_view(), name=f'{name_prefix}-attempts'),
+    ]
+
+
+# JSON is the only renderer, so skip the '.<format>' suffix routes (halves the router's patterns)
 router = DefaultRouter()
+router.include_format_suffixes = False
 router.register(r'passages', PassageViewSet, basename='passage')
 router.register(r'questions', QuestionViewSet, basename='question')
 router.register(r'lessons', LessonViewSet, basename='lesson')
@@ -35,35 +51,43 @@ router.register(r'writing-sections', WritingSectionViewSet, basename='writing-se
 router.register(r'math-sections', MathSectionViewSet, basename='math-section')
 router.register(r'classifications', QuestionClassificationViewSet, basename='classification')
 
+# Progress endpoints, mounted under a single 'progress/' prefix so other
+# requests skip them with one prefix check
+progress_urlpatterns = [
+    # Passage progress endpoints
+    path('passages/<hexuuid:passage_id>', PassageProgressView.as_view(), name='progress-passage'),
+    path('passages/<hexuuid:passage_id>/start', StartSessionView.as_view(), name='progress-start'),
+    *progress_patterns('passages', 'passage_id', 'progress',
+                       SubmitPassageView, ReviewPassageView, PassageAttemptsView),
+    
+    # Writing section progress endpoints
+    *progress_patterns('writing-sections', 'writing_section_id', 'progress-writing',
+                       SubmitWritingSectionView, ReviewWritingSectionView, WritingSectionAttemptsView),
+    
+    # Math section progress endpoints
+    *progress_patterns('math-sections', 'math_section_id', 'progress-math',
+                       SubmitMathSectionView, ReviewMathSectionView, MathSectionAttemptsView),
+    
+    # Lesson progress endpoints
+    *progress_patterns('lessons', 'lesson_id', 'progress-lesson',
+                       SubmitLessonView, ReviewLessonView, LessonAttemptsView),
+]
+
 urlpatterns = [
     # Passages and Questions (handled by router)
     path('', include(router.urls)),
     
     # Progress endpoints
     path('progress', ProgressView.as_view(), name='progress'),
-    path('progress/passages/<str:passage_id>', PassageProgressView.as_view(), name='progress-passage'),
-    path('progress/passages/<str:passage_id>/start', StartSessionView.as_view(), name='progress-start'),
-    path('progress/passages/<str:passage_id>/submit', SubmitPassageView.as_view(), name='progress-submit'),
-    path('progress/passages/<str:passage_id>/review', ReviewPassageView.as_view(), name='progress-review'),
-    path('progress/passages/<str:passage_id>/attempts', PassageAttemptsView.as_view(), name='progress-attempts'),
-    
-    # Writing section progress endpoints
-    path('progress/writing-sections/<str:writing_section_id>/submit', SubmitWritingSectionView.as_view(), name='progress-writing-submit'),
-    path('progress/writing-sections/<str:writing_section_id>/review', ReviewWritingSectionView.as_view(), name='progress-writing-review'),
-    path('progress/writing-sections/<str:writing_section_id>/attempts', WritingSectionAttemptsView.as_view(), name='progress-writing-attempts'),
-    
-    # Math section progress endpoints
-    path('progress/math-sections/<str:math_section_id>/submit', SubmitMathSectionView.as_view(), name='progress-math-submit'),
-    path('progress/math-sections/<str:math_section_id>/review', ReviewMathSectionView.as_view(), name='progress-math-review'),
-    path('progress/math-sections/<str:math_section_id>/attempts', MathSectionAttemptsView.as_view(), name='progress-math-attempts'),
+    path('progress/', include(progress_urlpatterns)),
     
     # Answers endpoints
     path('answers', AnswerView.as_view(), name='answers'),
-    path('answers/passage/<str:passage_id>', AnswerView.as_view(), name='answers-passage'),
+    path('answers/passage/<hexuuid:passage_id>', AnswerView.as_view(), name='answers-passage'),
     
     # Admin endpoints
     path('admin/passages', AdminPassageView.as_view(), name='admin-passages'),
-    path('admin/passages/<str:passage_id>', AdminPassageView.as_view(), name='admin-passage-detail'),
+    path('admin/passages/<hexuuid:passage_id>', AdminPassageView.as_view(), name='admin-passage-detail'),
     
     # Authentication endpoints
     path('auth/register', register, name='register'),
@@ -106,11 +130,6 @@ urlpatterns = [
     path('onboarding/dismiss', OnboardingDismissView.as_view(), name='onboarding-dismiss'),
     path('onboarding/welcome-seen', OnboardingWelcomeSeenView.as_view(), name='onboarding-welcome-seen'),
     
-    # Lesson progress endpoints
-    path('progress/lessons/<str:lesson_id>/submit', SubmitLessonView.as_view(), name='progress-lesson-submit'),
-    path('progress/lessons/<str:lesson_id>/review', ReviewLessonView.as_view(), name='progress-lesson-review'),
-    path('progress/lessons/<str:lesson_id>/attempts', LessonAttemptsView.as_view(), name='progress-lesson-attempts'),
-    
     # Argos Control monitoring endpoints
     path('argos/health', argos_health, name='argos-health'),
     path('argos/metrics', argos_metrics, name='argos-metrics'),
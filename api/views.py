@@ -1,51 +1,241 @@
-from rest_framework import viewsets, status
+from rest_framework import viewsets, status, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, F
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.core.cache import cache
+from django.db.models import Q, Count, F, Max, Prefetch, OuterRef, Subquery, Sum, prefetch_related_objects
 from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from datetime import timedelta, date
+from functools import lru_cache
 import uuid
-import json
+import hashlib
 import os
-from django.conf import settings
 
 from .models import (
-    Passage, Question, QuestionOption, User, UserSession,
+    Passage, Question, QuestionOption, PassageAnnotation, User, UserSession,
     UserProgress, UserAnswer, WordOfTheDay, PassageAttempt,
     Lesson, LessonQuestion, LessonQuestionOption, LessonAttempt,
     WritingSection, WritingSectionSelection, WritingSectionQuestion, WritingSectionQuestionOption,
     WritingSectionAttempt,
-    MathSection, MathQuestion, MathQuestionOption, MathAsset, MathSectionAttempt,
-    QuestionClassification, StudyPlan
+    MathSection, MathQuestion, MathQuestionOption, MathAsset, MathQuestionAsset, MathSectionAttempt,
+    QuestionClassification, StudyPlan, PASSAGE_COUNT_CACHE_KEY, WORD_OF_THE_DAY_CACHE_KEY
 )
 from .serializers import (
     PassageListSerializer, PassageDetailSerializer, QuestionListSerializer,
     QuestionSerializer, UserProgressSerializer, UserProgressSummarySerializer,
     UserAnswerSerializer, SubmitPassageRequestSerializer, SubmitPassageResponseSerializer,
     ReviewResponseSerializer, ReviewAnswerSerializer, CreatePassageSerializer,
-    PassageAnnotationSerializer, WordOfTheDaySerializer,
+    WordOfTheDaySerializer,
     LessonListSerializer, LessonDetailSerializer, LessonQuestionSerializer,
-    WritingSectionListSerializer, WritingSectionDetailSerializer, WritingSectionQuestionSerializer,
+    WritingSectionListSerializer, WritingSectionDetailSerializer,
     SubmitWritingSectionRequestSerializer, SubmitWritingSectionResponseSerializer,
     WritingSectionAttemptSerializer,
-    MathSectionListSerializer, MathSectionDetailSerializer, MathQuestionSerializer,
+    MathSectionListSerializer, MathSectionDetailSerializer,
     QuestionClassificationSerializer, UserStrengthWeaknessSerializer
 )
+from .converters import UUID_PATTERN, parse_uuid
+from .pagination import CachedCountLimitOffsetPagination
 from .onboarding_utils import get_onboarding_data, dismiss_prompt, mark_welcome_seen
+from .word_gpt_utils import generate_word, take_banked_word
 
 
-class PassageViewSet(viewsets.ReadOnlyModelViewSet):
+@lru_cache(maxsize=None)
+def serializer_only_fields(serializer_class):
+    """
+    Model columns a ModelSerializer actually reads, for use with QuerySet.only().
+    Nested ModelSerializers on forward relations (e.g. header) contribute their
+    own columns via 'relation__field' so select_related() stays narrow too.
+    """
+    model = serializer_class.Meta.model
+    declared_fields = serializer_class._declared_fields
+    only_fields = []
+    for name in serializer_class.Meta.fields:
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue  # SerializerMethodField / annotation, not a column
+        if not model_field.concrete or model_field.many_to_many:
+            continue
+        only_fields.append(name)
+        nested = declared_fields.get(name)
+        if model_field.is_relation and isinstance(nested, serializers.ModelSerializer):
+            only_fields.extend(f'{name}__{sub}' for sub in serializer_only_fields(type(nested)))
+    return tuple(only_fields)
+
+
+def subquery_count(model, fk_field):
+    """
+    Correlated COUNT(*) of model rows pointing at the outer row through fk_field.
+    Unlike several Count() annotations on one queryset, each count is its own
+    subquery, so the relations aren't joined together and multiplied.
+    """
+    counts = (
+        model.objects.filter(**{fk_field: OuterRef('pk')})
+        .order_by().values(fk_field).annotate(count=Count('*')).values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def annotation_rows(annotations):
+    """
+    Render a PassageAnnotation queryset in PassageAnnotationSerializer's shape
+    from values() rows, without model instances or per-field serializer calls.
+    """
+    return [
+        {
+            'id': str(ann['id']),
+            'question_id': str(ann['question_id']) if ann['question_id'] else None,
+            'start_char': ann['start_char'],
+            'end_char': ann['end_char'],
+            'selected_text': ann['selected_text'],
+            'explanation': ann['explanation'],
+            'order': ann['order'],
+        }
+        for ann in annotations.values(
+            'id', 'question_id', 'start_char', 'end_char', 'selected_text', 'explanation', 'order'
+        )
+    ]
+
+
+class ConditionalListMixin:
+    """
+    ETag-based conditional GET for content list endpoints.
+
+    The ETag hashes one aggregate over the filtered listing (row count, latest
+    updated_at of the rows and their headers, and totals of the child counts
+    get_queryset annotates) plus the requesting user's attempt count and latest
+    attempt, so a client revalidating an unchanged listing gets a 304 for two
+    cheap queries, without any serialization or per-row attempt queries.
+    """
+    # Child-count annotations from get_queryset (subquery_count) whose totals go into the ETag
+    etag_count_annotations = ()
+    attempt_model = None
+    attempt_field = None  # FK on attempt_model to the listed model, e.g. 'passage'
+    # Listings that include per-user attempt data must never be shared between users
+    list_cache_control = {'private': True, 'no_cache': True}
+
+    def get_list_etag(self, request):
+        listing = self.filter_queryset(self.get_queryset()).order_by().aggregate(
+            row_count=Count('pk'),
+            updated_at=Max('updated_at'),
+            header_updated_at=Max('header__updated_at'),
+            **{f'{name}_total': Sum(name) for name in self.etag_count_annotations},
+        )
+        user = get_user_from_request(request)
+        attempts = None
+        if user and self.attempt_model:
+            attempts = self.attempt_model.objects.filter(user=user).aggregate(
+                attempt_count=Count('pk'),
+                latest_completed_at=Max('completed_at'),
+            )
+        key = repr((request.query_params.urlencode(), user.pk if user else None, listing, attempts))
+        return '"%s"' % hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+    def list(self, request, *args, **kwargs):
+        etag = self.get_list_etag(request)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is None:
+            response = super().list(request, *args, **kwargs)
+            response['ETag'] = etag
+        else:
+            response = not_modified
+        patch_cache_control(response, **self.list_cache_control)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        self.page_attempts = self.get_page_attempts(queryset if page is None else page)
+        return page
+
+    def get_page_attempts(self, objects):
+        """
+        The requesting user's attempts on the listed objects, newest first and
+        grouped by object pk: one query for the page, where the list serializers'
+        attempt_count/attempt_summary would otherwise query several times per row.
+        None for anonymous users, who have no attempt data.
+        """
+        user = get_user_from_request(self.request)
+        if not (user and self.attempt_model and self.attempt_field):
+            return None
+        attempts = {obj.pk: [] for obj in objects}
+        rows = self.attempt_model.objects.filter(
+            user=user, **{f'{self.attempt_field}__in': list(attempts)}
+        ).order_by('-completed_at').values(
+            'id', self.attempt_field, 'score', 'correct_count', 'total_questions', 'completed_at'
+        )
+        for row in rows:
+            attempts[row.pop(self.attempt_field)].append(row)
+        return attempts
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['page_attempts'] = getattr(self, 'page_attempts', None)
+        return context
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag and short-lived caching for content detail endpoints.
+
+    Detail payloads have no per-user fields, so they may be cached briefly by
+    clients and proxies (varied on Authorization, since premium gating depends
+    on the caller). The ETag is built before serializing, from the object's and
+    its header's updated_at, its tier and the caller's premium status, and the
+    row count and latest updated_at of each relation in etag_child_relations, so
+    a matching If-None-Match returns a 304 without serializing the payload.
+    Options and assets have no updated_at of their own; edits to them go
+    through the admin, which saves (and so touches) the parent row.
+    """
+    retrieve_cache_control = {'public': True, 'max_age': 60, 'stale_while_revalidate': 300}
+    # Reverse relations (related_name) whose count and latest updated_at go into the ETag
+    etag_child_relations = ()
+
+    def get_retrieve_etag(self, request, obj):
+        header = getattr(obj, 'header', None)
+        key = [obj.pk, obj.updated_at, header.updated_at if header else None, obj.tier, is_premium_user(request)]
+        for relation in self.etag_child_relations:
+            children = getattr(obj, relation).order_by()
+            aggregates = {'count': Count('pk')}
+            try:
+                children.model._meta.get_field('updated_at')
+                aggregates['updated_at'] = Max('updated_at')
+            except FieldDoesNotExist:
+                pass
+            key.append(children.aggregate(**aggregates))
+        return '"%s"' % hashlib.md5(repr(key).encode(), usedforsecurity=False).hexdigest()
+
+    def conditional_retrieve_response(self, request, obj):
+        etag = self.get_retrieve_etag(request, obj)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(self.get_serializer(obj).data)
+            response['ETag'] = etag
+        patch_cache_control(response, **self.retrieve_cache_control)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+
+
+class PassageViewSet(ConditionalListMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for passages endpoints.
     GET /passages - List all passages
     GET /passages/:id - Get passage detail
     GET /passages/:id/questions - Get questions for a passage
     """
+    # Malformed ids 404 at URL resolution instead of reaching the lookup
+    # (all the content viewsets below do the same)
+    lookup_value_regex = UUID_PATTERN
     queryset = Passage.objects.all()
     serializer_class = PassageListSerializer
+    etag_count_annotations = ('question_count',)
+    attempt_model = PassageAttempt
+    attempt_field = 'passage'
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -61,11 +251,10 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """Get passage detail with premium check"""
         passage = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if passage is premium and user doesn't have access
         if passage.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -75,11 +264,18 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        return super().retrieve(request, *args, **kwargs)
+        # Reuse the instance fetched above; super().retrieve() would query it again
+        serializer = self.get_serializer(passage)
+        return Response(serializer.data)
     
     def get_queryset(self):
+        if self.action in ('questions', 'annotations'):
+            # These actions only read id/tier off the passage itself: skip the
+            # header join and question count the list/detail rendering needs
+            return self.filter_queryset_params(Passage.objects.only('id', 'tier'))
         queryset = Passage.objects.annotate(
-            question_count=Count('questions'),
+            # A correlated count keeps the header join free of a GROUP BY over every column
+            question_count=subquery_count(Question, 'passage'),
             header_display_order=Coalesce('header__display_order', 0)
         ).select_related('header').order_by(
             '-header_display_order',
@@ -87,20 +283,26 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
             '-display_order',
             '-created_at'
         )
+        if self.action == 'list':
+            # Only load the columns the list serializer renders
+            queryset = queryset.only(*serializer_only_fields(self.get_serializer_class()))
+        elif self.action == 'retrieve':
+            # The detail serializer renders every question's options
+            queryset = queryset.prefetch_related('questions__options')
+        return self.filter_queryset_params(queryset)
+    
+    def filter_queryset_params(self, queryset):
+        """Apply the difficulty/tier query params"""
         difficulty = self.request.query_params.get('difficulty', None)
         tier = self.request.query_params.get('tier', None)
         
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
         
-        # Get user for premium check
-        user = get_user_from_request(self.request)
-        is_premium_user = user and (user.is_premium or user.has_active_subscription)
-        
         # Handle tier filtering
         if tier:
             # If explicitly requesting premium tier, check access
-            if tier == 'premium' and not is_premium_user:
+            if tier == 'premium' and not is_premium_user(self.request):
                 # Non-premium users requesting premium get empty result
                 queryset = queryset.none()
             else:
@@ -117,11 +319,10 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
     def questions(self, request, pk=None):
         """Get questions for a passage without correct answers/explanations"""
         passage = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if passage is premium and user doesn't have access
         if passage.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -131,9 +332,25 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        questions = passage.questions.all().order_by('order')
-        serializer = QuestionListSerializer(questions, many=True)
-        return Response({'questions': serializer.data})
+        # Same shape as QuestionListSerializer, built from plain rows: one query for
+        # the questions and one for all of their options, no model instances
+        questions = list(passage.questions.order_by('order').values('id', 'text', 'explanation', 'order'))
+        options_by_question = {}
+        for question_id, option_text in QuestionOption.objects.filter(
+            question_id__in=[q['id'] for q in questions]
+        ).order_by('order').values_list('question_id', 'text'):
+            options_by_question.setdefault(question_id, []).append(option_text)
+        
+        return Response({'questions': [
+            {
+                'id': str(q['id']),
+                'text': q['text'],
+                'options': options_by_question.get(q['id'], []),
+                'explanation': q['explanation'],
+                'order': q['order'],
+            }
+            for q in questions
+        ]})
     
     @action(detail=True, methods=['get'])
     def annotations(self, request, pk=None):
@@ -147,7 +364,7 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
         
         # Check if passage is premium and user doesn't have access
         if passage.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -157,31 +374,21 @@ class PassageViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        # Get all annotations for this passage
-        all_annotations = passage.annotations.all().select_related('question')
-        
-        # Filter: only show annotations for questions the user has answered
+        # Only show annotations for questions the user has answered
+        # (or annotations with no question_id - show those too)
         if user:
-            # Get all question IDs the user has answered for this passage
-            answered_question_ids = set(
-                UserAnswer.objects.filter(
-                    user=user,
-                    question__passage=passage
-                ).values_list('question_id', flat=True)
-            )
-            
-            # Filter annotations to only those for answered questions
-            # (or annotations with no question_id - show those too)
-            filtered_annotations = [
-                ann for ann in all_annotations
-                if ann.question_id is None or ann.question_id in answered_question_ids
-            ]
+            answered_question_ids = UserAnswer.objects.filter(
+                user=user,
+                question__passage=passage
+            ).values('question_id')
+            filtered_annotations = annotation_rows(passage.annotations.filter(
+                Q(question_id__isnull=True) | Q(question_id__in=answered_question_ids)
+            ))
         else:
             # Anonymous users don't see any annotations
             filtered_annotations = []
         
-        serializer = PassageAnnotationSerializer(filtered_annotations, many=True)
-        return Response({'annotations': serializer.data})
+        return Response({'annotations': filtered_annotations})
 
 
 class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
@@ -189,24 +396,58 @@ class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
     ViewSet for questions endpoints.
     GET /questions/:id - Get a specific question
     """
-    queryset = Question.objects.all()
+    lookup_value_regex = UUID_PATTERN
+    # Both serializers render every question's options
+    queryset = Question.objects.prefetch_related('options')
     serializer_class = QuestionSerializer
     
-    def retrieve(self, request, *args, **kwargs):
-        """Get question without correct answer for active sessions"""
-        question = self.get_object()
-        serializer = QuestionListSerializer(question)
-        return Response(serializer.data)
+    def get_serializer_class(self):
+        # Retrieve omits the correct answer for active sessions
+        if self.action == 'retrieve':
+            return QuestionListSerializer
+        return QuestionSerializer
 
 
 def get_user_from_request(request):
-    """Helper function to get user from request (supports JWT authentication)"""
+    """
+    Helper function to get user from request (supports JWT authentication).
+    DRF authenticates once per request and memoizes the result on request.user,
+    so repeated calls within a view don't decode the token or query again.
+    """
     # Check if user is authenticated via JWT or session
     if hasattr(request, 'user') and request.user.is_authenticated:
         return request.user
     return None
 
 
+def is_premium_user(request):
+    """
+    Whether the requesting user has premium access (premium flag or active subscription).
+    JWT-authenticated users arrive with is_premium_effective annotated by
+    PremiumJWTAuthentication; otherwise the check runs has_active_subscription
+    once and caches the result on the request, since get_queryset, retrieve and
+    the detail actions may all ask within one request.
+    """
+    if not hasattr(request, '_is_premium_user'):
+        user = get_user_from_request(request)
+        if user is None:
+            request._is_premium_user = False
+        elif hasattr(user, 'is_premium_effective'):
+            request._is_premium_user = user.is_premium_effective
+        else:
+            request._is_premium_user = bool(user.is_premium or user.has_active_subscription)
+    return request._is_premium_user
+
+
+def calculate_score(correct_count, total_questions):
+    """
+    Percentage score, truncated, in integer arithmetic. The old
+    int(correct / total * 100) could land just below the true value
+    (29/100 -> 28) because of float rounding.
+    """
+    return correct_count * 100 // total_questions if total_questions > 0 else 0
+
+
 class ProgressView(APIView):
     """
     View for user progress endpoints.
@@ -223,14 +464,16 @@ class ProgressView(APIView):
             # For anonymous users, return empty progress
             progress_queryset = UserProgress.objects.none()
         
-        completed_passages = list(
-            progress_queryset.filter(is_completed=True).values_list('passage_id', flat=True)
-        )
+        # One query for both structures: the two columns of every completed row
+        completed_rows = list(progress_queryset.filter(is_completed=True).values_list('passage_id', 'score'))
+        completed_passages = [passage_id for passage_id, _ in completed_rows]
         scores = {
-            str(progress.passage_id): progress.score
-            for progress in progress_queryset.filter(is_completed=True, score__isnull=False)
+            str(passage_id): score
+            for passage_id, score in completed_rows
+            if score is not None
         }
-        total_passages = Passage.objects.count()
+        # Only changes when passages are added/removed (invalidated by a Passage signal)
+        total_passages = cache.get_or_set(PASSAGE_COUNT_CACHE_KEY, Passage.objects.count, 60)
         completed_count = len(completed_passages)
         
         serializer = UserProgressSummarySerializer({
@@ -251,15 +494,7 @@ class PassageProgressView(APIView):
     def get(self, request, passage_id):
         """GET /progress/passages/:passage_id"""
         user = get_user_from_request(request)
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
         if user:
             progress, _ = UserProgress.objects.get_or_create(
@@ -288,15 +523,7 @@ class StartSessionView(APIView):
     def post(self, request, passage_id):
         """POST /progress/passages/:passage_id/start"""
         user = get_user_from_request(request)
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
         # For now, just return a session ID
         # In a full implementation, you'd create a session record
@@ -318,15 +545,8 @@ class SubmitPassageView(APIView):
     def post(self, request, passage_id):
         """POST /progress/passages/:passage_id/submit"""
         user = get_user_from_request(request)
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        # Only the passage id is needed here; skip loading the large content column
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
         serializer = SubmitPassageRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -334,80 +554,90 @@ class SubmitPassageView(APIView):
         answers_data = serializer.validated_data['answers']
         time_spent = serializer.validated_data.get('time_spent_seconds', 0)
         
-        # Get all questions for the passage
-        questions = passage.questions.all().order_by('order')
-        question_dict = {str(q.id): q for q in questions}
+        # Scoring only needs these columns, so read them as plain dicts keyed by id
+        # (every question is read, not just the submitted ones, since the score is out
+        # of total_questions; order_by() drops the Meta ordering a dict lookup doesn't need)
+        question_meta = {
+            row['id']: row
+            for row in passage.questions.order_by().values('id', 'correct_answer_index', 'explanation')
+        }
+        
+        # Get and serialize annotations for the answered questions in one pass (logged-in users only)
+        annotations_by_question = {}
+        if user:
+            answered_ids = [a['question_id'] for a in answers_data if a['question_id'] in question_meta]
+            for ann_data in annotation_rows(passage.annotations.filter(
+                question_id__in=answered_ids
+            ).order_by('start_char')):
+                annotations_by_question.setdefault(ann_data['question_id'], []).append(ann_data)
         
         # Process answers
         answer_results = []
+        new_answers = []
         correct_count = 0
-        total_questions = questions.count()
+        total_questions = len(question_meta)
         
         for answer_data in answers_data:
-            question_id = str(answer_data['question_id'])
-            if question_id not in question_dict:
+            question_id = answer_data['question_id']
+            question = question_meta.get(question_id)
+            if question is None:
                 continue
             
-            question = question_dict[question_id]
             selected_index = answer_data['selected_option_index']
-            is_correct = selected_index == question.correct_answer_index
+            is_correct = selected_index == question['correct_answer_index']
             
             if is_correct:
                 correct_count += 1
             
             # Save user answer (create new record for each attempt)
             if user:
-                UserAnswer.objects.create(
+                new_answers.append(UserAnswer(
                     user=user,
-                    question=question,
+                    question_id=question_id,
                     selected_option_index=selected_index,
                     is_correct=is_correct,
-                )
-            
-            # Get annotations for this question (now that user has answered)
-            annotations = []
-            if user:  # Only include annotations if user is authenticated
-                from .serializers import PassageAnnotationSerializer
-                question_annotations = question.annotations.all().order_by('start_char')
-                annotations = PassageAnnotationSerializer(question_annotations, many=True).data
+                ))
             
             answer_results.append({
-                'question_id': question_id,
+                'question_id': str(question_id),
                 'selected_option_index': selected_index,
-                'correct_answer_index': question.correct_answer_index,
+                'correct_answer_index': question['correct_answer_index'],
                 'is_correct': is_correct,
-                'explanation': question.explanation,
-                'annotations': annotations,  # Include annotations for this question
+                'explanation': question['explanation'],
+                # Annotations for this question (now that user has answered; empty for anonymous)
+                'annotations': annotations_by_question.get(str(question_id), []),
             })
         
         # Calculate score
-        score = int((correct_count / total_questions * 100)) if total_questions > 0 else 0
+        score = calculate_score(correct_count, total_questions)
         
         # Create a new attempt record (for logged-in users only)
         attempt = None
         if user:
             from .models import PassageAttempt
-            attempt = PassageAttempt.objects.create(
-                user=user,
-                passage=passage,
-                score=score,
-                correct_count=correct_count,
-                total_questions=total_questions,
-                time_spent_seconds=time_spent,
-                answers_data=answer_results,
-            )
-            
-            # Also update UserProgress to track latest (for backward compatibility)
-            UserProgress.objects.update_or_create(
-                user=user,
-                passage=passage,
-                defaults={
-                    'is_completed': True,
-                    'score': score,  # Store latest score
-                    'time_spent_seconds': time_spent,
-                    'completed_at': timezone.now(),
-                }
-            )
+            with transaction.atomic():
+                UserAnswer.objects.bulk_create(new_answers)
+                attempt = PassageAttempt.objects.create(
+                    user=user,
+                    passage=passage,
+                    score=score,
+                    correct_count=correct_count,
+                    total_questions=total_questions,
+                    time_spent_seconds=time_spent,
+                    answers_data=answer_results,
+                )
+                
+                # Also update UserProgress to track latest (for backward compatibility)
+                UserProgress.objects.update_or_create(
+                    user=user,
+                    passage=passage,
+                    defaults={
+                        'is_completed': True,
+                        'score': score,  # Store latest score
+                        'time_spent_seconds': time_spent,
+                        'completed_at': timezone.now(),
+                    }
+                )
         
         response_data = {
             'passage_id': str(passage.id),
@@ -433,15 +663,7 @@ class ReviewPassageView(APIView):
     def get(self, request, passage_id):
         """GET /progress/passages/:passage_id/review"""
         user = get_user_from_request(request)
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
         # Get user progress
         if user:
@@ -455,63 +677,63 @@ class ReviewPassageView(APIView):
         
         # Get user answers
         if user:
+            # Keyed by the raw UUID; ids are stringified by the renderer. Only the
+            # columns the covering (user, question) index carries are read, and the
+            # keys double as the answered ids for the annotations prefetch below
             user_answers = {
-                str(ua.question_id): ua
-                for ua in UserAnswer.objects.filter(user=user, question__passage=passage)
+                question_id: (selected_option_index, is_correct)
+                for question_id, selected_option_index, is_correct in UserAnswer.objects.filter(
+                    user=user, question__passage=passage
+                ).values_list('question_id', 'selected_option_index', 'is_correct')
             }
         else:
             user_answers = {}
         
-        # Build review data
-        review_answers = []
-        questions = passage.questions.all().order_by('order')
-        
-        # Get annotations for answered questions
+        # Build review data: questions with their ordered options and, for answered
+        # questions, their annotations - one prefetch each, then a single pass
+        prefetches = [
+            Prefetch('options', queryset=QuestionOption.objects.order_by('order'), to_attr='ordered_options'),
+        ]
         if user:
-            answered_question_ids = set(
-                UserAnswer.objects.filter(
-                    user=user,
-                    question__passage=passage
-                ).values_list('question_id', flat=True)
-            )
-            # Get annotations for answered questions
-            annotations_by_question = {}
-            for ann in passage.annotations.filter(question_id__in=answered_question_ids).select_related('question'):
-                q_id = str(ann.question_id)
-                if q_id not in annotations_by_question:
-                    annotations_by_question[q_id] = []
-                annotations_by_question[q_id].append({
-                    'id': str(ann.id),
-                    'start_char': ann.start_char,
-                    'end_char': ann.end_char,
-                    'selected_text': ann.selected_text,
-                    'explanation': ann.explanation,
-                    'order': ann.order,
-                })
-        else:
-            annotations_by_question = {}
+            prefetches.append(Prefetch(
+                'annotations',
+                queryset=PassageAnnotation.objects.filter(question_id__in=user_answers.keys()).order_by('start_char'),
+                to_attr='answered_annotations',
+            ))
+        questions = list(passage.questions.order_by('order').prefetch_related(*prefetches))
         
+        review_answers = []
         correct_count = 0
-        total_questions = questions.count()
+        total_questions = len(questions)
         
         for question in questions:
-            user_answer = user_answers.get(str(question.id))
-            options = [opt.text for opt in question.options.all().order_by('order')]
+            selected_option_index, is_correct = user_answers.get(question.id, (None, None))
+            options = [opt.text for opt in question.ordered_options]
             
             # Count correct answers
-            if user_answer and user_answer.is_correct:
+            if is_correct:
                 correct_count += 1
             
             # Include annotations for this question if user has answered it
-            question_annotations = annotations_by_question.get(str(question.id), [])
+            question_annotations = [
+                {
+                    'id': str(ann.id),
+                    'start_char': ann.start_char,
+                    'end_char': ann.end_char,
+                    'selected_text': ann.selected_text,
+                    'explanation': ann.explanation,
+                    'order': ann.order,
+                }
+                for ann in getattr(question, 'answered_annotations', ())
+            ]
             
             review_answers.append({
-                'question_id': str(question.id),
+                'question_id': question.id,
                 'question_text': question.text,
                 'options': options,
-                'selected_option_index': user_answer.selected_option_index if user_answer else None,
+                'selected_option_index': selected_option_index,
                 'correct_answer_index': question.correct_answer_index,
-                'is_correct': user_answer.is_correct if user_answer else None,
+                'is_correct': is_correct,
                 'explanation': question.explanation,
                 'annotations': question_annotations,  # Annotations for this question
             })
@@ -548,8 +770,15 @@ class AnswerView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        question_uuid = parse_uuid(question_id)
+        if question_uuid is None:
+            return Response(
+                {'error': {'code': 'BAD_REQUEST', 'message': 'question_id must be a valid UUID'}},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         try:
-            question = Question.objects.get(id=question_id)
+            question = Question.objects.get(id=question_uuid)
         except Question.DoesNotExist:
             return Response(
                 {'error': {'code': 'NOT_FOUND', 'message': 'Question not found'}},
@@ -567,8 +796,10 @@ class AnswerView(APIView):
                     'is_correct': is_correct,
                 }
             )
-            # Fetch with annotations prefetched for serializer
-            user_answer = UserAnswer.objects.select_related('question').prefetch_related('question__annotations').get(pk=user_answer.pk)
+            # The question is already loaded: attach its annotations for the serializer
+            # instead of re-reading the answer just saved
+            user_answer.question = question
+            prefetch_related_objects([question], 'annotations')
             # Include annotations for this question (now that user has answered)
             serializer = UserAnswerSerializer(user_answer)
             return Response(serializer.data)
@@ -585,15 +816,7 @@ class AnswerView(APIView):
     def get(self, request, passage_id):
         """GET /answers/passage/:passage_id"""
         user = get_user_from_request(request)
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
         if user:
             answers = UserAnswer.objects.filter(user=user, question__passage=passage).select_related('question').prefetch_related('question__annotations')
@@ -616,90 +839,67 @@ class AdminPassageView(APIView):
         serializer = CreatePassageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Create passage
-        passage = Passage.objects.create(
-            title=serializer.validated_data['title'],
-            content=serializer.validated_data['content'],
-            difficulty=serializer.validated_data['difficulty'],
-        )
-        
-        # Create questions and options
-        for q_data in serializer.validated_data['questions']:
-            question = Question.objects.create(
-                passage=passage,
-                text=q_data['text'],
-                correct_answer_index=q_data['correct_answer_index'],
-                explanation=q_data.get('explanation'),
-                order=q_data['order'],
+        with transaction.atomic():
+            # Create passage
+            passage = Passage.objects.create(
+                title=serializer.validated_data['title'],
+                content=serializer.validated_data['content'],
+                difficulty=serializer.validated_data['difficulty'],
             )
             
-            # Create options
-            for idx, option_text in enumerate(q_data['options']):
-                QuestionOption.objects.create(
-                    question=question,
-                    text=option_text,
-                    order=idx,
-                )
+            # Create questions and options
+            self._create_questions(passage, serializer.validated_data['questions'])
         
+        # The detail response renders every question's options: load them in one query
+        prefetch_related_objects([passage], 'questions__options')
         response_serializer = PassageDetailSerializer(passage)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
     def put(self, request, passage_id):
         """PUT /admin/passages/:id"""
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage, id=passage_id)
         
         serializer = CreatePassageSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        # Update passage
-        passage.title = serializer.validated_data['title']
-        passage.content = serializer.validated_data['content']
-        passage.difficulty = serializer.validated_data['difficulty']
-        passage.save()
-        
-        # Delete existing questions
-        passage.questions.all().delete()
+        with transaction.atomic():
+            # Update passage
+            passage.title = serializer.validated_data['title']
+            passage.content = serializer.validated_data['content']
+            passage.difficulty = serializer.validated_data['difficulty']
+            passage.save()
+            
+            # Delete existing questions
+            passage.questions.all().delete()
+            
+            # Create new questions and options
+            self._create_questions(passage, serializer.validated_data['questions'])
         
-        # Create new questions and options
-        for q_data in serializer.validated_data['questions']:
-            question = Question.objects.create(
+        prefetch_related_objects([passage], 'questions__options')
+        response_serializer = PassageDetailSerializer(passage)
+        return Response(response_serializer.data)
+    
+    def _create_questions(self, passage, questions_data):
+        """Create a passage's questions and their options with one bulk INSERT each"""
+        questions = Question.objects.bulk_create([
+            Question(
                 passage=passage,
                 text=q_data['text'],
                 correct_answer_index=q_data['correct_answer_index'],
                 explanation=q_data.get('explanation'),
                 order=q_data['order'],
             )
-            
-            # Create options
-            for idx, option_text in enumerate(q_data['options']):
-                QuestionOption.objects.create(
-                    question=question,
-                    text=option_text,
-                    order=idx,
-                )
-        
-        response_serializer = PassageDetailSerializer(passage)
-        return Response(response_serializer.data)
+            for q_data in questions_data
+        ])
+        QuestionOption.objects.bulk_create([
+            QuestionOption(question=question, text=option_text, order=idx)
+            for question, q_data in zip(questions, questions_data)
+            for idx, option_text in enumerate(q_data['options'])
+        ])
     
     def delete(self, request, passage_id):
         """DELETE /admin/passages/:id"""
-        # Convert string to UUID (handles both uppercase and lowercase)
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         passage.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -714,59 +914,53 @@ class PassageAttemptsView(APIView):
         """GET /progress/passages/:passage_id/attempts"""
         user = get_user_from_request(request)
         
-        # Fallback: check request.user directly if get_user_from_request didn't work
-        if not user and hasattr(request, 'user') and request.user.is_authenticated:
-            user = request.user
-        
         if not user:
             return Response(
                 {'error': {'code': 'UNAUTHORIZED', 'message': 'Authentication required. Please log in.'}},
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        # Convert string to UUID
-        try:
-            passage_uuid = uuid.UUID(str(passage_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid passage ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        passage = get_object_or_404(Passage, id=passage_uuid)
+        passage = get_object_or_404(Passage.objects.only('id'), id=passage_id)
         
-        # Get all attempts for this user and passage
+        # Get all attempts for this user and passage as plain dicts
+        # (no model instances, and no per-row passage lookup for passage_id).
+        # answers_data is the large per-answer JSON column; it is listed explicitly
+        # because this endpoint returns it - score-only paths should defer it.
         attempts = PassageAttempt.objects.filter(
             user=user,
             passage=passage
-        ).order_by('-completed_at')
+        ).order_by('-completed_at').values(
+            'id', 'passage_id', 'score', 'correct_count', 'total_questions',
+            'time_spent_seconds', 'completed_at', 'answers_data',
+        ).iterator(chunk_size=200)
         
         from .serializers import PassageAttemptSerializer
-        # Convert attempts to serializer format
-        attempts_data = []
-        for attempt in attempts:
-            attempts_data.append({
-                'id': attempt.id,
-                'passage_id': str(attempt.passage.id),
-                'score': attempt.score,
-                'correct_count': attempt.correct_count,
-                'total_questions': attempt.total_questions,
-                'time_spent_seconds': attempt.time_spent_seconds,
-                'completed_at': attempt.completed_at,
-                'answers': attempt.answers_data or [],
-            })
-        serializer = PassageAttemptSerializer(attempts_data, many=True)
+        
+        def attempts_data():
+            # Convert attempts to serializer format one row at a time, so Django's
+            # row cache never holds every answers_data blob alongside the output
+            for attempt in attempts:
+                attempt['answers'] = attempt.pop('answers_data') or []
+                yield attempt
+        
+        serializer = PassageAttemptSerializer(attempts_data(), many=True)
         return Response(serializer.data)
 
 
-class LessonViewSet(viewsets.ReadOnlyModelViewSet):
+class LessonViewSet(ConditionalListMixin, ConditionalRetrieveMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for lessons endpoints.
     GET /lessons - List all lessons
     GET /lessons/:id - Get lesson detail
     """
+    lookup_value_regex = UUID_PATTERN
     queryset = Lesson.objects.all()
     serializer_class = LessonListSerializer
+    pagination_class = CachedCountLimitOffsetPagination
+    etag_count_annotations = ('question_count',)
+    etag_child_relations = ('questions', 'assets')
+    # The lesson listing has no per-user data, so it may be cached like the details
+    list_cache_control = ConditionalRetrieveMixin.retrieve_cache_control
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -776,11 +970,10 @@ class LessonViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """Get lesson detail with premium check"""
         lesson = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if lesson is premium and user doesn't have access
         if lesson.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -790,12 +983,16 @@ class LessonViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        return super().retrieve(request, *args, **kwargs)
+        # Reuse the instance fetched above; super().retrieve() would query it again
+        return self.conditional_retrieve_response(request, lesson)
     
     def get_queryset(self):
         queryset = Lesson.objects.annotate(
-            question_count=Count('questions')
+            question_count=subquery_count(LessonQuestion, 'lesson')
         ).select_related('header')  # Optimize header loading
+        if self.action == 'list':
+            # Only load the columns the list serializer renders
+            queryset = queryset.only(*serializer_only_fields(self.get_serializer_class()))
         difficulty = self.request.query_params.get('difficulty', None)
         tier = self.request.query_params.get('tier', None)
         lesson_type = self.request.query_params.get('lesson_type', None)
@@ -806,13 +1003,9 @@ class LessonViewSet(viewsets.ReadOnlyModelViewSet):
         if lesson_type:
             queryset = queryset.filter(lesson_type=lesson_type)
         
-        # Get user for premium check
-        user = get_user_from_request(self.request)
-        is_premium_user = user and (user.is_premium or user.has_active_subscription)
-        
         # Handle tier filtering
         if tier:
-            if tier == 'premium' and not is_premium_user:
+            if tier == 'premium' and not is_premium_user(self.request):
                 queryset = queryset.none()
             else:
                 queryset = queryset.filter(tier=tier)
@@ -823,15 +1016,21 @@ class LessonViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
 
-class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
+class WritingSectionViewSet(ConditionalListMixin, ConditionalRetrieveMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for writing sections endpoints.
     GET /writing-sections - List all writing sections
     GET /writing-sections/:id - Get writing section detail
     GET /writing-sections/:id/questions - Get questions for a writing section
     """
+    lookup_value_regex = UUID_PATTERN
     queryset = WritingSection.objects.all()
     serializer_class = WritingSectionListSerializer
+    etag_count_annotations = ('question_count', 'selection_count')
+    etag_child_relations = ('questions', 'selections')
+    pagination_class = CachedCountLimitOffsetPagination
+    attempt_model = WritingSectionAttempt
+    attempt_field = 'writing_section'
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -841,11 +1040,10 @@ class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """Get writing section detail with premium check"""
         writing_section = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if writing section is premium and user doesn't have access
         if writing_section.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -855,12 +1053,13 @@ class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        return super().retrieve(request, *args, **kwargs)
+        # Reuse the instance fetched above; super().retrieve() would query it again
+        return self.conditional_retrieve_response(request, writing_section)
     
     def get_queryset(self):
         queryset = WritingSection.objects.annotate(
-            question_count=Count('questions'),
-            selection_count=Count('selections'),
+            question_count=subquery_count(WritingSectionQuestion, 'writing_section'),
+            selection_count=subquery_count(WritingSectionSelection, 'writing_section'),
             header_display_order=Coalesce('header__display_order', 0)
         ).select_related('header').order_by(
             '-header_display_order',
@@ -868,19 +1067,21 @@ class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
             '-display_order',
             '-created_at'
         )
+        if self.action == 'list':
+            # Only load the columns the list serializer renders
+            queryset = queryset.only(*serializer_only_fields(self.get_serializer_class()))
+        elif self.action == 'questions':
+            # The questions action only reads id/tier off the section itself
+            queryset = queryset.defer('content')
         difficulty = self.request.query_params.get('difficulty', None)
         tier = self.request.query_params.get('tier', None)
         
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
         
-        # Get user for premium check
-        user = get_user_from_request(self.request)
-        is_premium_user = user and (user.is_premium or user.has_active_subscription)
-        
         # Handle tier filtering
         if tier:
-            if tier == 'premium' and not is_premium_user:
+            if tier == 'premium' and not is_premium_user(self.request):
                 queryset = queryset.none()
             else:
                 queryset = queryset.filter(tier=tier)
@@ -894,11 +1095,10 @@ class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
     def questions(self, request, pk=None):
         """Get questions for a writing section without correct answers/explanations"""
         writing_section = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if writing section is premium and user doesn't have access
         if writing_section.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -908,20 +1108,48 @@ class WritingSectionViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        questions = writing_section.questions.all().order_by('order')
-        serializer = WritingSectionQuestionSerializer(questions, many=True)
-        return Response({'questions': serializer.data})
+        # Same shape as WritingSectionQuestionSerializer, built from plain rows: one
+        # query for the questions and one for all of their options
+        questions = list(writing_section.questions.order_by('order').values(
+            'id', 'text', 'correct_answer_index', 'explanation', 'order', 'selection_number'
+        ))
+        options_by_question = {}
+        for question_id, option_id, option_text, option_order in WritingSectionQuestionOption.objects.filter(
+            question_id__in=[q['id'] for q in questions]
+        ).order_by('order').values_list('question_id', 'id', 'text', 'order'):
+            options_by_question.setdefault(question_id, []).append(
+                {'id': str(option_id), 'text': option_text, 'order': option_order}
+            )
+        
+        return Response({'questions': [
+            {
+                'id': str(q['id']),
+                'text': q['text'],
+                'options': options_by_question.get(q['id'], []),
+                'correct_answer_index': q['correct_answer_index'],
+                'explanation': q['explanation'],
+                'order': q['order'],
+                'selection_number': q['selection_number'],
+            }
+            for q in questions
+        ]})
 
 
-class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
+class MathSectionViewSet(ConditionalListMixin, ConditionalRetrieveMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for math sections endpoints.
     GET /math-sections - List all math sections
     GET /math-sections/:id - Get math section detail
     GET /math-sections/:id/questions - Get questions for a math section
     """
+    lookup_value_regex = UUID_PATTERN
     queryset = MathSection.objects.all()
     serializer_class = MathSectionListSerializer
+    etag_count_annotations = ('question_count', 'asset_count')
+    etag_child_relations = ('questions', 'assets')
+    pagination_class = CachedCountLimitOffsetPagination
+    attempt_model = MathSectionAttempt
+    attempt_field = 'math_section'
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -937,11 +1165,10 @@ class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """Get math section detail with premium check"""
         math_section = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if math section is premium and user doesn't have access
         if math_section.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -951,12 +1178,13 @@ class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        return super().retrieve(request, *args, **kwargs)
+        # Reuse the instance fetched above; super().retrieve() would query it again
+        return self.conditional_retrieve_response(request, math_section)
     
     def get_queryset(self):
         queryset = MathSection.objects.annotate(
-            question_count=Count('questions'),
-            asset_count=Count('assets'),
+            question_count=subquery_count(MathQuestion, 'math_section'),
+            asset_count=subquery_count(MathAsset, 'math_section'),
             header_display_order=Coalesce('header__display_order', 0)
         ).select_related('header').order_by(
             '-header_display_order',
@@ -964,19 +1192,18 @@ class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
             '-display_order',
             '-created_at'
         )
+        if self.action == 'list':
+            # Only load the columns the list serializer renders
+            queryset = queryset.only(*serializer_only_fields(self.get_serializer_class()))
         difficulty = self.request.query_params.get('difficulty', None)
         tier = self.request.query_params.get('tier', None)
         
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
         
-        # Get user for premium check
-        user = get_user_from_request(self.request)
-        is_premium_user = user and (user.is_premium or user.has_active_subscription)
-        
         # Handle tier filtering
         if tier:
-            if tier == 'premium' and not is_premium_user:
+            if tier == 'premium' and not is_premium_user(self.request):
                 queryset = queryset.none()
             else:
                 queryset = queryset.filter(tier=tier)
@@ -990,11 +1217,10 @@ class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
     def questions(self, request, pk=None):
         """Get questions for a math section without correct answers/explanations"""
         math_section = self.get_object()
-        user = get_user_from_request(request)
         
         # Check if math section is premium and user doesn't have access
         if math_section.tier == 'premium':
-            if not user or not (user.is_premium or user.has_active_subscription):
+            if not is_premium_user(request):
                 return Response(
                     {'error': {
                         'code': 'PREMIUM_REQUIRED',
@@ -1004,305 +1230,85 @@ class MathSectionViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_403_FORBIDDEN
                 )
         
-        questions = math_section.questions.all().order_by('order')
-        serializer = MathQuestionSerializer(questions, many=True)
-        return Response({'results': serializer.data})
-
-
-class SubmitWritingSectionView(APIView):
-    """
-    View for submitting answers to a writing section.
-    POST /progress/writing-sections/:writing_section_id/submit - Submit answers
-    
-    Supports incremental submissions (one question at a time) and aggregates into final attempt.
-    """
-    
-    def post(self, request, writing_section_id):
-        """POST /progress/writing-sections/:writing_section_id/submit"""
-        user = get_user_from_request(request)
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(writing_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid writing section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
+        # Same shape as MathQuestionSerializer, built from plain rows: one query each
+        # for the questions, their options and their assets instead of two per question
+        questions = list(math_section.questions.order_by('order').values(
+            'id', 'question_id', 'prompt', 'correct_answer_index', 'explanation', 'order'
+        ))
+        question_ids = [q['id'] for q in questions]
+        options_by_question = {}
+        for question_id, option_id, option_text, option_order in MathQuestionOption.objects.filter(
+            question_id__in=question_ids
+        ).order_by('order').values_list('question_id', 'id', 'text', 'order'):
+            options_by_question.setdefault(question_id, []).append(
+                {'id': str(option_id), 'text': option_text, 'order': option_order}
             )
-        writing_section = get_object_or_404(WritingSection, id=section_uuid)
-        
-        serializer = SubmitWritingSectionRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
-        answers_data = serializer.validated_data['answers']
-        time_spent = serializer.validated_data.get('time_spent_seconds', 0)
-        is_complete = request.data.get('is_complete', False)
-        
-        # Get all questions for the writing section
-        questions = writing_section.questions.all().order_by('order')
-        question_dict = {str(q.id): q for q in questions}
-        total_questions_in_section = questions.count()
-        
-        # Check if there's an in-progress attempt
-        in_progress_attempt = None
-        if user:
-            recent_attempts = WritingSectionAttempt.objects.filter(
-                user=user,
-                writing_section=writing_section
-            ).order_by('-created_at')
-            
-            if recent_attempts.exists():
-                latest_attempt = recent_attempts.first()
-                if len(latest_attempt.answers_data) < total_questions_in_section:
-                    in_progress_attempt = latest_attempt
-        
-        # Process answers
-        answer_results = []
-        if in_progress_attempt:
-            # Merge with existing answers
-            existing_answers = {a['question_id']: a for a in in_progress_attempt.answers_data}
-            
-            for answer_data in answers_data:
-                question_id = str(answer_data['question_id'])
-                if question_id not in question_dict:
-                    continue
-                
-                question = question_dict[question_id]
-                selected_index = answer_data['selected_option_index']
-                is_correct = selected_index == question.correct_answer_index
-                
-                answer_result = {
-                    'question_id': question_id,
-                    'selected_option_index': selected_index,
-                    'correct_answer_index': question.correct_answer_index,
-                    'is_correct': is_correct,
-                    'explanation': question.explanation,
-                }
-                existing_answers[question_id] = answer_result
-            
-            answer_results = list(existing_answers.values())
-        else:
-            # New submission
-            for answer_data in answers_data:
-                question_id = str(answer_data['question_id'])
-                if question_id not in question_dict:
-                    continue
-                
-                question = question_dict[question_id]
-                selected_index = answer_data['selected_option_index']
-                is_correct = selected_index == question.correct_answer_index
-                
-                # Note: UserAnswer is only for Passage questions
-                # Writing section answers are stored in WritingSectionAttempt.answers_data (JSON field)
-                
-                answer_results.append({
-                    'question_id': question_id,
-                    'selected_option_index': selected_index,
-                    'correct_answer_index': question.correct_answer_index,
-                    'is_correct': is_correct,
-                    'explanation': question.explanation,
-                })
-        
-        # Calculate score
-        correct_count = sum(1 for a in answer_results if a.get('is_correct', False))
-        total_questions_answered = len(answer_results)
-        is_final_submission = is_complete or (total_questions_answered >= total_questions_in_section)
-        
-        total_questions_for_score = total_questions_in_section if is_final_submission else total_questions_answered
-        score = int((correct_count / total_questions_for_score * 100)) if total_questions_for_score > 0 else 0
-        
-        # Update or create attempt record
-        attempt = None
-        if user:
-            if in_progress_attempt and not is_final_submission:
-                # Update existing in-progress attempt
-                in_progress_attempt.answers_data = answer_results
-                in_progress_attempt.correct_count = correct_count
-                in_progress_attempt.total_questions = total_questions_answered
-                in_progress_attempt.time_spent_seconds = time_spent
-                in_progress_attempt.save()
-                attempt = in_progress_attempt
-            elif in_progress_attempt:
-                # Finalize existing attempt
-                in_progress_attempt.score = score
-                in_progress_attempt.correct_count = correct_count
-                in_progress_attempt.total_questions = total_questions_in_section
-                in_progress_attempt.answers_data = answer_results
-                in_progress_attempt.time_spent_seconds = time_spent
-                in_progress_attempt.save()
-                attempt = in_progress_attempt
-            else:
-                # Create new attempt
-                attempt = WritingSectionAttempt.objects.create(
-                    user=user,
-                    writing_section=writing_section,
-                    score=score,
-                    correct_count=correct_count,
-                    total_questions=total_questions_in_section if is_final_submission else total_questions_answered,
-                    time_spent_seconds=time_spent,
-                    answers_data=answer_results,
-                )
-        
-        response_data = {
-            'writing_section_id': str(writing_section.id),
-            'score': score,
-            'total_questions': total_questions_in_section,
-            'total_questions_answered': total_questions_answered,
-            'correct_count': correct_count,
-            'is_completed': is_final_submission,
-            'answers': answer_results,
-            'completed_at': timezone.now().isoformat() if is_final_submission else None,
-            'attempt_id': str(attempt.id) if attempt else None,
-        }
-        
-        serializer = SubmitWritingSectionResponseSerializer(response_data)
-        return Response(serializer.data)
-
-
-class ReviewWritingSectionView(APIView):
-    """
-    View for getting review data for a completed writing section.
-    GET /progress/writing-sections/:writing_section_id/review - Get review data
-    """
-    
-    def get(self, request, writing_section_id):
-        """GET /progress/writing-sections/:writing_section_id/review"""
-        user = get_user_from_request(request)
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(writing_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid writing section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
+        assets_by_question = {}
+        for question_id, asset_pk, asset_id, asset_type, s3_url in MathQuestionAsset.objects.filter(
+            question_id__in=question_ids
+        ).order_by('asset__asset_id').values_list(
+            'question_id', 'asset__id', 'asset__asset_id', 'asset__type', 'asset__s3_url'
+        ):
+            assets_by_question.setdefault(question_id, []).append(
+                {'id': str(asset_pk), 'asset_id': asset_id, 'type': asset_type, 's3_url': s3_url}
             )
-        writing_section = get_object_or_404(WritingSection, id=section_uuid)
-        
-        # Get the most recent attempt for this user and writing section
-        attempt = None
-        if user:
-            attempt = WritingSectionAttempt.objects.filter(
-                user=user,
-                writing_section=writing_section
-            ).order_by('-completed_at').first()
-        
-        # Build review data from the attempt
-        review_answers = []
-        questions = writing_section.questions.all().order_by('order')
-        
-        correct_count = 0
-        total_questions = questions.count()
-        
-        # Get answers from attempt if available
-        attempt_answers = {}
-        if attempt and attempt.answers_data:
-            for ans in attempt.answers_data:
-                attempt_answers[str(ans.get('question_id'))] = ans
         
-        for question in questions:
-            question_id_str = str(question.id)
-            attempt_answer = attempt_answers.get(question_id_str)
-            options = [opt.text for opt in question.options.all().order_by('order')]
-            
-            # Count correct answers
-            if attempt_answer and attempt_answer.get('is_correct'):
-                correct_count += 1
-            
-            review_answers.append({
-                'question_id': question_id_str,
-                'question_text': question.text,
+        results = []
+        for q in questions:
+            options = options_by_question.get(q['id'], [])
+            results.append({
+                'id': str(q['id']),
+                'question_id': q['question_id'],
+                'prompt': q['prompt'],
+                'choices': [option['text'] for option in options],
                 'options': options,
-                'selected_option_index': attempt_answer.get('selected_option_index') if attempt_answer else None,
-                'correct_answer_index': question.correct_answer_index,
-                'is_correct': attempt_answer.get('is_correct', False) if attempt_answer else False,
-                'explanation': question.explanation,
+                'correct_answer_index': q['correct_answer_index'],
+                'explanation': q['explanation'],
+                'order': q['order'],
+                'assets': assets_by_question.get(q['id'], []),
             })
-        
-        score = int((correct_count / total_questions * 100)) if total_questions > 0 else 0
-        
-        response_data = {
-            'writing_section_id': str(writing_section.id),
-            'score': score,
-            'total_questions': total_questions,
-            'correct_count': correct_count,
-            'answers': review_answers,
-        }
-        
-        serializer = ReviewResponseSerializer(response_data)
-        return Response(serializer.data)
+        return Response({'results': results})
 
 
-class WritingSectionAttemptsView(APIView):
+class SectionProgressMixin:
     """
-    View for getting past attempts for a writing section.
-    GET /progress/writing-sections/:writing_section_id/attempts - Get all attempts for a writing section
+    Shared configuration for the writing/math section progress views.
+
+    Writing and math sections store attempts the same way (answers_data JSON on
+    a per-section attempt model), so Submit/Review/Attempts are implemented once
+    and each concrete view only sets the models and URL kwarg below. Responses
+    always use writing_section_id, which the shared serializers expect.
     """
-    
-    def get(self, request, writing_section_id):
-        """GET /progress/writing-sections/:writing_section_id/attempts"""
-        user = get_user_from_request(request)
-        
-        if not user:
-            return Response(
-                {'error': {'code': 'UNAUTHORIZED', 'message': 'Authentication required. Please log in.'}},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-        
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(writing_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid writing section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        writing_section = get_object_or_404(WritingSection, id=section_uuid)
-        
-        # Get all attempts for this user and writing section
-        attempts = WritingSectionAttempt.objects.filter(
-            user=user,
-            writing_section=writing_section
-        ).order_by('-completed_at')
-        
-        # Convert attempts to serializer format
-        attempts_data = []
-        for attempt in attempts:
-            attempts_data.append({
-                'id': attempt.id,
-                'writing_section_id': str(attempt.writing_section.id),
-                'score': attempt.score,
-                'correct_count': attempt.correct_count,
-                'total_questions': attempt.total_questions,
-                'time_spent_seconds': attempt.time_spent_seconds,
-                'completed_at': attempt.completed_at,
-                'answers': attempt.answers_data or [],
-            })
-        serializer = WritingSectionAttemptSerializer(attempts_data, many=True)
-        return Response(serializer.data)
+    section_model = None
+    attempt_model = None
+    option_model = None
+    section_field = None  # FK name on attempt_model, e.g. 'writing_section'
+    section_kwarg = None  # URL kwarg, e.g. 'writing_section_id'
+
+    def get_section(self, kwargs):
+        return get_object_or_404(self.section_model.objects.only('id'), id=kwargs[self.section_kwarg])
+
+    def get_attempts(self, user, section):
+        return self.attempt_model.objects.filter(user=user, **{self.section_field: section})
+
+    def format_explanation(self, explanation):
+        return explanation
 
+    def get_question_text(self, question):
+        return question.text
 
-class SubmitMathSectionView(APIView):
+
+class SectionSubmitView(SectionProgressMixin, APIView):
     """
-    View for submitting answers to a math section.
-    POST /progress/math-sections/:math_section_id/submit - Submit answers
+    Submit answers to a writing/math section.
     
     Supports incremental submissions (one question at a time) and aggregates into final attempt.
     """
     
-    def post(self, request, math_section_id):
-        """POST /progress/math-sections/:math_section_id/submit"""
+    def post(self, request, **kwargs):
         user = get_user_from_request(request)
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(math_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid math section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        math_section = get_object_or_404(MathSection, id=section_uuid)
+        section = self.get_section(kwargs)
         
-        # Use the same serializer as writing sections
         serializer = SubmitWritingSectionRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
@@ -1310,67 +1316,63 @@ class SubmitMathSectionView(APIView):
         time_spent = serializer.validated_data.get('time_spent_seconds', 0)
         is_complete = request.data.get('is_complete', False)
         
-        # Get all questions for the math section
-        questions = math_section.questions.all().order_by('order')
-        question_dict = {str(q.id): q for q in questions}
-        total_questions_in_section = questions.count()
+        # Optional client key so a double-tapped submit doesn't create a second attempt
+        idempotency_key = request.headers.get('Idempotency-Key') or None
+        if idempotency_key and len(idempotency_key) > 64:
+            return Response(
+                {'error': {'code': 'BAD_REQUEST', 'message': 'Idempotency-Key must be at most 64 characters'}},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Only the scoring columns, as plain dicts keyed by the id string answers carry
+        question_dict = {
+            str(row['id']): row
+            for row in section.questions.order_by().values('id', 'correct_answer_index', 'explanation')
+        }
+        total_questions_in_section = len(question_dict)
+        
+        # A replayed Idempotency-Key gets the attempt its first request wrote, unchanged
+        if user and idempotency_key:
+            replayed_attempt = self.get_attempts(user, section).filter(idempotency_key=idempotency_key).first()
+            if replayed_attempt:
+                return self.submit_response(
+                    section, replayed_attempt, replayed_attempt.answers_data,
+                    calculate_score(replayed_attempt.correct_count, replayed_attempt.total_questions),
+                    replayed_attempt.correct_count, total_questions_in_section,
+                    replayed_attempt.total_questions >= total_questions_in_section,
+                )
         
         # Check if there's an in-progress attempt
         in_progress_attempt = None
         if user:
-            recent_attempts = MathSectionAttempt.objects.filter(
-                user=user,
-                math_section=math_section
-            ).order_by('-created_at')
-            
-            if recent_attempts.exists():
-                latest_attempt = recent_attempts.first()
-                if len(latest_attempt.answers_data) < total_questions_in_section:
-                    in_progress_attempt = latest_attempt
+            latest_attempt = self.get_attempts(user, section).order_by('-created_at').first()
+            if latest_attempt and len(latest_attempt.answers_data) < total_questions_in_section:
+                in_progress_attempt = latest_attempt
         
-        # Process answers
-        answer_results = []
-        if in_progress_attempt:
-            # Merge with existing answers
-            existing_answers = {a['question_id']: a for a in in_progress_attempt.answers_data}
+        # Process answers; an in-progress attempt's answers are merged with the new ones
+        existing_answers = (
+            {a['question_id']: a for a in in_progress_attempt.answers_data} if in_progress_attempt else {}
+        )
+        new_answers = []
+        for answer_data in answers_data:
+            question_id = str(answer_data['question_id'])
+            if question_id not in question_dict:
+                continue
             
-            for answer_data in answers_data:
-                question_id = str(answer_data['question_id'])
-                if question_id not in question_dict:
-                    continue
-                
-                question = question_dict[question_id]
-                selected_index = answer_data['selected_option_index']
-                is_correct = selected_index == question.correct_answer_index
-                
-                answer_result = {
-                    'question_id': question_id,
-                    'selected_option_index': selected_index,
-                    'correct_answer_index': question.correct_answer_index,
-                    'is_correct': is_correct,
-                    'explanation': question.explanation or '',
-                }
+            question = question_dict[question_id]
+            selected_index = answer_data['selected_option_index']
+            answer_result = {
+                'question_id': question_id,
+                'selected_option_index': selected_index,
+                'correct_answer_index': question['correct_answer_index'],
+                'is_correct': selected_index == question['correct_answer_index'],
+                'explanation': self.format_explanation(question['explanation']),
+            }
+            if in_progress_attempt:
                 existing_answers[question_id] = answer_result
-            
-            answer_results = list(existing_answers.values())
-        else:
-            # New submission
-            for answer_data in answers_data:
-                question_id = str(answer_data['question_id'])
-                if question_id not in question_dict:
-                    continue
-                
-                question = question_dict[question_id]
-                selected_index = answer_data['selected_option_index']
-                is_correct = selected_index == question.correct_answer_index
-                
-                answer_results.append({
-                    'question_id': question_id,
-                    'selected_option_index': selected_index,
-                    'correct_answer_index': question.correct_answer_index,
-                    'is_correct': is_correct,
-                    'explanation': question.explanation or '',
-                })
+            else:
+                new_answers.append(answer_result)
+        answer_results = list(existing_answers.values()) if in_progress_attempt else new_answers
         
         # Calculate score
         correct_count = sum(1 for a in answer_results if a.get('is_correct', False))
@@ -1378,7 +1380,7 @@ class SubmitMathSectionView(APIView):
         is_final_submission = is_complete or (total_questions_answered >= total_questions_in_section)
         
         total_questions_for_score = total_questions_in_section if is_final_submission else total_questions_answered
-        score = int((correct_count / total_questions_for_score * 100)) if total_questions_for_score > 0 else 0
+        score = calculate_score(correct_count, total_questions_for_score)
         
         # Update or create attempt record
         attempt = None
@@ -1389,6 +1391,8 @@ class SubmitMathSectionView(APIView):
                 in_progress_attempt.correct_count = correct_count
                 in_progress_attempt.total_questions = total_questions_answered
                 in_progress_attempt.time_spent_seconds = time_spent
+                # Record the key on the attempt this request wrote, so replaying it is a no-op
+                in_progress_attempt.idempotency_key = idempotency_key or in_progress_attempt.idempotency_key
                 in_progress_attempt.save()
                 attempt = in_progress_attempt
             elif in_progress_attempt:
@@ -1398,25 +1402,38 @@ class SubmitMathSectionView(APIView):
                 in_progress_attempt.total_questions = total_questions_in_section
                 in_progress_attempt.answers_data = answer_results
                 in_progress_attempt.time_spent_seconds = time_spent
+                # Record the key on the attempt this request wrote, so replaying it is a no-op
+                in_progress_attempt.idempotency_key = idempotency_key or in_progress_attempt.idempotency_key
                 in_progress_attempt.save()
                 attempt = in_progress_attempt
             else:
-                # Create new attempt
-                attempt = MathSectionAttempt.objects.create(
-                    user=user,
-                    math_section=math_section,
-                    score=score,
-                    correct_count=correct_count,
-                    total_questions=total_questions_in_section if is_final_submission else total_questions_answered,
-                    time_spent_seconds=time_spent,
-                    answers_data=answer_results,
-                )
-        
+                # Create new attempt (or, for a replayed Idempotency-Key, reuse the one it created)
+                attempt_fields = {
+                    'score': score,
+                    'correct_count': correct_count,
+                    'total_questions': total_questions_for_score,
+                    'time_spent_seconds': time_spent,
+                    'answers_data': answer_results,
+                }
+                lookup = {'user': user, self.section_field: section}
+                if idempotency_key:
+                    attempt, _ = self.attempt_model.objects.get_or_create(
+                        idempotency_key=idempotency_key, defaults=attempt_fields, **lookup
+                    )
+                else:
+                    attempt = self.attempt_model.objects.create(**lookup, **attempt_fields)
+        
+        return self.submit_response(
+            section, attempt, answer_results, score, correct_count, total_questions_in_section, is_final_submission
+        )
+    
+    def submit_response(self, section, attempt, answer_results, score, correct_count,
+                        total_questions_in_section, is_final_submission):
         response_data = {
-            'writing_section_id': str(math_section.id),  # Use writing_section_id to match serializer
+            'writing_section_id': str(section.id),
             'score': score,
             'total_questions': total_questions_in_section,
-            'total_questions_answered': total_questions_answered,
+            'total_questions_answered': len(answer_results),
             'correct_count': correct_count,
             'is_completed': is_final_submission,
             'answers': answer_results,
@@ -1424,44 +1441,33 @@ class SubmitMathSectionView(APIView):
             'attempt_id': str(attempt.id) if attempt else None,
         }
         
-        # Use the same response serializer as writing sections (it expects writing_section_id)
         serializer = SubmitWritingSectionResponseSerializer(response_data)
         return Response(serializer.data)
 
 
-class ReviewMathSectionView(APIView):
+class SectionReviewView(SectionProgressMixin, APIView):
     """
-    View for getting review data for a completed math section.
-    GET /progress/math-sections/:math_section_id/review - Get review data
+    Review data for the user's most recent attempt at a writing/math section.
     """
     
-    def get(self, request, math_section_id):
-        """GET /progress/math-sections/:math_section_id/review"""
+    def get(self, request, **kwargs):
         user = get_user_from_request(request)
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(math_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid math section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        math_section = get_object_or_404(MathSection, id=section_uuid)
+        section = self.get_section(kwargs)
         
-        # Get the most recent attempt for this user and math section
+        # Get the most recent attempt for this user and section
         attempt = None
         if user:
-            attempt = MathSectionAttempt.objects.filter(
-                user=user,
-                math_section=math_section
-            ).order_by('-completed_at').first()
+            attempt = self.get_attempts(user, section).order_by('-completed_at').first()
         
         # Build review data from the attempt
         review_answers = []
-        questions = math_section.questions.all().order_by('order')
+        # Streamed in chunks (options prefetched per chunk) so only one chunk of
+        # question instances is alive at a time
+        questions = section.questions.order_by('order').prefetch_related(
+            Prefetch('options', queryset=self.option_model.objects.order_by('order'), to_attr='ordered_options')
+        ).iterator(chunk_size=50)
         
         correct_count = 0
-        total_questions = questions.count()
         
         # Get answers from attempt if available
         attempt_answers = {}
@@ -1472,7 +1478,7 @@ class ReviewMathSectionView(APIView):
         for question in questions:
             question_id_str = str(question.id)
             attempt_answer = attempt_answers.get(question_id_str)
-            options = [opt.text for opt in question.options.all().order_by('order')]
+            options = [opt.text for opt in question.ordered_options]
             
             # Count correct answers
             if attempt_answer and attempt_answer.get('is_correct'):
@@ -1480,18 +1486,19 @@ class ReviewMathSectionView(APIView):
             
             review_answers.append({
                 'question_id': question_id_str,
-                'question_text': question.prompt or question.text or '',
+                'question_text': self.get_question_text(question),
                 'options': options,
                 'selected_option_index': attempt_answer.get('selected_option_index') if attempt_answer else None,
                 'correct_answer_index': question.correct_answer_index,
                 'is_correct': attempt_answer.get('is_correct', False) if attempt_answer else False,
-                'explanation': question.explanation or '',
+                'explanation': self.format_explanation(question.explanation),
             })
         
-        score = int((correct_count / total_questions * 100)) if total_questions > 0 else 0
+        total_questions = len(review_answers)
+        score = calculate_score(correct_count, total_questions)
         
         response_data = {
-            'writing_section_id': str(math_section.id),  # Use writing_section_id to match serializer
+            'writing_section_id': str(section.id),
             'score': score,
             'total_questions': total_questions,
             'correct_count': correct_count,
@@ -1502,14 +1509,12 @@ class ReviewMathSectionView(APIView):
         return Response(serializer.data)
 
 
-class MathSectionAttemptsView(APIView):
+class SectionAttemptsView(SectionProgressMixin, APIView):
     """
-    View for getting past attempts for a math section.
-    GET /progress/math-sections/:math_section_id/attempts - Get all attempts for a math section
+    Past attempts for a writing/math section (authenticated users only).
     """
     
-    def get(self, request, math_section_id):
-        """GET /progress/math-sections/:math_section_id/attempts"""
+    def get(self, request, **kwargs):
         user = get_user_from_request(request)
         
         if not user:
@@ -1518,154 +1523,152 @@ class MathSectionAttemptsView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
         
-        # Convert string to UUID
-        try:
-            section_uuid = uuid.UUID(str(math_section_id))
-        except (ValueError, AttributeError):
-            return Response(
-                {'error': {'code': 'BAD_REQUEST', 'message': 'Invalid math section ID format'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        section = self.get_section(kwargs)
         
-        math_section = get_object_or_404(MathSection, id=section_uuid)
-        
-        # Get all attempts for this user and math section
-        attempts = MathSectionAttempt.objects.filter(
-            user=user,
-            math_section=math_section
-        ).order_by('-completed_at')
-        
-        # Convert attempts to serializer format
-        attempts_data = []
-        for attempt in attempts:
-            attempts_data.append({
-                'id': attempt.id,
-                'writing_section_id': str(attempt.math_section.id),  # Use writing_section_id to match serializer
-                'score': attempt.score,
-                'correct_count': attempt.correct_count,
-                'total_questions': attempt.total_questions,
-                'time_spent_seconds': attempt.time_spent_seconds,
-                'completed_at': attempt.completed_at,
-                'answers': attempt.answers_data or [],
-            })
+        # Get all attempts for this user and section as plain dicts
+        attempts = self.get_attempts(user, section).order_by('-completed_at').values(
+            'id', 'score', 'correct_count', 'total_questions',
+            'time_spent_seconds', 'completed_at', 'answers_data',
+        )
         
-        # Use the same serializer as writing sections (they have the same structure)
+        # Convert attempts to serializer format; every row shares the section id
+        section_id = str(section.id)
+        attempts_data = [
+            {
+                'id': attempt['id'],
+                'writing_section_id': section_id,
+                'score': attempt['score'],
+                'correct_count': attempt['correct_count'],
+                'total_questions': attempt['total_questions'],
+                'time_spent_seconds': attempt['time_spent_seconds'],
+                'completed_at': attempt['completed_at'],
+                'answers': attempt['answers_data'] or [],
+            }
+            for attempt in attempts
+        ]
         serializer = WritingSectionAttemptSerializer(attempts_data, many=True)
         return Response(serializer.data)
 
 
+class WritingSectionProgressMixin(SectionProgressMixin):
+    section_model = WritingSection
+    attempt_model = WritingSectionAttempt
+    option_model = WritingSectionQuestionOption
+    section_field = 'writing_section'
+    section_kwarg = 'writing_section_id'
+
+
+class MathSectionProgressMixin(SectionProgressMixin):
+    section_model = MathSection
+    attempt_model = MathSectionAttempt
+    option_model = MathQuestionOption
+    section_field = 'math_section'
+    section_kwarg = 'math_section_id'
+
+    def format_explanation(self, explanation):
+        return explanation or ''
+
+    def get_question_text(self, question):
+        # MathQuestion has no text field; prompt is its JSON list of blocks
+        return question.prompt or ''
+
+
+class SubmitWritingSectionView(WritingSectionProgressMixin, SectionSubmitView):
+    """POST /progress/writing-sections/:writing_section_id/submit - Submit answers"""
+
+
+class ReviewWritingSectionView(WritingSectionProgressMixin, SectionReviewView):
+    """GET /progress/writing-sections/:writing_section_id/review - Get review data"""
+
+
+class WritingSectionAttemptsView(WritingSectionProgressMixin, SectionAttemptsView):
+    """GET /progress/writing-sections/:writing_section_id/attempts - Get all attempts for a writing section"""
+
+
+class SubmitMathSectionView(MathSectionProgressMixin, SectionSubmitView):
+    """POST /progress/math-sections/:math_section_id/submit - Submit answers"""
+
+
+class ReviewMathSectionView(MathSectionProgressMixin, SectionReviewView):
+    """GET /progress/math-sections/:math_section_id/review - Get review data"""
+
+
+class MathSectionAttemptsView(MathSectionProgressMixin, SectionAttemptsView):
+    """GET /progress/math-sections/:math_section_id/attempts - Get all attempts for a math section"""
+
+
 class WordOfTheDayView(APIView):
     """
     GET /word-of-the-day - Get today's word of the day
-    Generates a new word using AI if one doesn't exist for today
+    Words are normally pre-generated by the generate_words_of_the_day command; if
+    today has none, a banked word is used, and only as a last resort one is generated with AI
     """
+    word_cache_timeout = 60
+    generation_lock_key = 'wotd:lock:%s'
+    generation_lock_timeout = 30
     
     def get(self, request):
         today = date.today()
+        cache_key = WORD_OF_THE_DAY_CACHE_KEY % today.isoformat()
+        
+        # The word only changes once a day, so serve the serialized payload from cache
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
         
         # Try to get today's word
         word_of_day = WordOfTheDay.objects.filter(date=today).first()
         
         if word_of_day:
-            serializer = WordOfTheDaySerializer(word_of_day)
-            return Response(serializer.data)
-        
-        # Generate new word using AI
-        try:
-            word_data = self._generate_word_with_ai()
-            if word_data:
-                word_of_day = WordOfTheDay.objects.create(
-                    word=word_data['word'],
-                    definition=word_data['definition'],
-                    synonyms=word_data['synonyms'],
-                    example_sentence=word_data['example_sentence'],
-                    date=today
-                )
-                serializer = WordOfTheDaySerializer(word_of_day)
-                return Response(serializer.data)
-            else:
-                return Response(
-                    {'error': {'code': 'INTERNAL_ERROR', 'message': 'Failed to generate word of the day'}},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-        except Exception as e:
-            # Fallback to a default word if AI fails
-            return Response(
-                {'error': {'code': 'INTERNAL_ERROR', 'message': f'Error generating word: {str(e)}'}},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+            return Response(self._cache_word(cache_key, word_of_day))
+        
+        # Generate new word using AI. Only the request holding the lock calls out;
+        # concurrent requests serve the latest stored word instead of waiting. The lock
+        # lives in the per-process cache (LocMemCache), so it only dedupes within a worker;
+        # across workers get_or_create keeps a single row for the day
+        lock_key = self.generation_lock_key % today.isoformat()
+        error_message = 'Failed to generate word of the day'
+        if cache.add(lock_key, 1, self.generation_lock_timeout):
+            try:
+                # A word banked by bulk generation saves the OpenAI call
+                word_of_day = take_banked_word(today)
+                if word_of_day is None:
+                    word_data = generate_word()
+                    if word_data:
+                        word_of_day, _ = WordOfTheDay.objects.get_or_create(
+                            date=today,
+                            defaults={
+                                'word': word_data['word'],
+                                'definition': word_data['definition'],
+                                'synonyms': word_data['synonyms'],
+                                'example_sentence': word_data['example_sentence'],
+                            },
+                        )
+                if word_of_day:
+                    return Response(self._cache_word(cache_key, word_of_day))
+            except Exception as e:
+                error_message = f'Error generating word: {str(e)}'
+            finally:
+                cache.delete(lock_key)
+        
+        # Fall back to the most recent stored word rather than failing the request
+        latest_word = WordOfTheDay.objects.order_by('-date').first()
+        if latest_word:
+            return Response(WordOfTheDaySerializer(latest_word).data)
+        return Response(
+            {'error': {'code': 'INTERNAL_ERROR', 'message': error_message}},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
     
-    def _generate_word_with_ai(self):
-        """Generate word of the day using OpenAI"""
-        api_key = settings.OPENAI_API_KEY
-        
-        if not api_key:
-            # Fallback: return a default word if no API key
-            return {
-                'word': 'Eloquent',
-                'definition': 'Fluent or persuasive in speaking or writing.',
-                'synonyms': ['Articulate', 'Fluent', 'Expressive', 'Well-spoken'],
-                'example_sentence': 'The eloquent speaker captivated the audience with her powerful words.'
-            }
-        
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
-            
-            prompt = """Generate a SAT-level vocabulary word with the following format (return as JSON):
-{
-  "word": "the vocabulary word",
-  "definition": "a clear, concise definition suitable for SAT prep",
-  "synonyms": ["synonym1", "synonym2", "synonym3", "synonym4"],
-  "example_sentence": "a sentence demonstrating the word's usage in context"
-}
-
-Choose a word that is:
-- Appropriate for SAT vocabulary level (not too easy, not too obscure)
-- Useful for academic reading comprehension
-- Can be clearly defined and has good synonyms
-
-Return ONLY valid JSON, no other text."""
-            
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates SAT vocabulary words in JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
-            
-            content = response.choices[0].message.content.strip()
-            
-            # Try to parse JSON (might have markdown code blocks)
-            if content.startswith('```'):
-                # Remove markdown code blocks
-                lines = content.split('\n')
-                content = '\n'.join([line for line in lines if not line.strip().startswith('```')])
-            
-            word_data = json.loads(content)
-            
-            # Validate required fields
-            required_fields = ['word', 'definition', 'synonyms', 'example_sentence']
-            if all(field in word_data for field in required_fields):
-                # Ensure synonyms is a list
-                if isinstance(word_data['synonyms'], str):
-                    word_data['synonyms'] = [s.strip() for s in word_data['synonyms'].split(',')]
-                return word_data
-        
-        except Exception as e:
-            # Fallback on any error
-            pass
-        
-        # Fallback word
-        return {
-            'word': 'Eloquent',
-            'definition': 'Fluent or persuasive in speaking or writing.',
-            'synonyms': ['Articulate', 'Fluent', 'Expressive', 'Well-spoken'],
-            'example_sentence': 'The eloquent speaker captivated the audience with her powerful words.'
-        }
+    def _cache_word(self, cache_key, word_of_day):
+        """
+        Serialize the word and cache it briefly. The cache is per worker process
+        (LocMemCache), so the invalidation receiver only clears the worker that saved
+        an admin edit; the short TTL bounds how long the others serve the old word.
+        """
+        data = WordOfTheDaySerializer(word_of_day).data
+        cache.set(cache_key, data, self.word_cache_timeout)
+        return data
 
 
 class QuestionClassificationViewSet(viewsets.ReadOnlyModelViewSet):
@@ -1674,6 +1677,7 @@ class QuestionClassificationViewSet(viewsets.ReadOnlyModelViewSet):
     GET /classifications - List all classifications
     GET /classifications/:id - Get classification detail
     """
+    lookup_value_regex = UUID_PATTERN
     queryset = QuestionClassification.objects.all()
     serializer_class = QuestionClassificationSerializer
     
@@ -1710,12 +1714,16 @@ class UserProfileView(APIView):
             lesson_question_ids = list(classification.lesson_questions.values_list('id', flat=True))
             
             # Count answers from passage attempts (UserAnswer tracks these)
-            passage_answers = UserAnswer.objects.filter(
+            # Both counts from one aggregate instead of two COUNT queries
+            passage_counts = UserAnswer.objects.filter(
                 user=user,
                 question_id__in=passage_question_ids
+            ).aggregate(
+                total=Count('id'),
+                correct=Count('id', filter=Q(is_correct=True)),
             )
-            passage_correct = passage_answers.filter(is_correct=True).count()
-            passage_total = passage_answers.count()
+            passage_correct = passage_counts['correct']
+            passage_total = passage_counts['total']
             
             # For lesson questions, we check WritingSectionAttempt and MathSectionAttempt answers_data
             # These store answers as JSON: {question_id, selected_option_index, is_correct, etc.}
@@ -1786,7 +1794,7 @@ class UserProfileView(APIView):
             'user': {
                 'id': str(user.id),
                 'email': user.email,
-                'is_premium': user.is_premium or user.has_active_subscription,
+                'is_premium': is_premium_user(request),
             },
             'performance': performance_data,
             'strengths': strengths[:5],  # Top 5 strengths
@@ -1852,8 +1860,11 @@ class DiagnosticSubmitView(APIView):
         
         # Handle reading diagnostic (passage-based)
         if passage_id:
+            passage_uuid = parse_uuid(passage_id)
+            if passage_uuid is None:
+                return Response({'error': 'Passage not found'}, status=status.HTTP_404_NOT_FOUND)
             try:
-                passage = Passage.objects.get(id=passage_id)
+                passage = Passage.objects.get(id=passage_uuid)
             except Passage.DoesNotExist:
                 return Response({'error': 'Passage not found'}, status=status.HTTP_404_NOT_FOUND)
             
@@ -1864,8 +1875,10 @@ class DiagnosticSubmitView(APIView):
             performance = {}
             
             for answer in answers:
-                question_id = answer.get('question_id')
+                question_id = parse_uuid(answer.get('question_id'))
                 is_correct = answer.get('is_correct', False)
+                if question_id is None:
+                    continue
                 
                 try:
                     question = Question.objects.get(id=question_id)
@@ -1912,8 +1925,11 @@ class DiagnosticSubmitView(APIView):
         if not lesson_id:
             return Response({'error': 'lesson_id or passage_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         
+        lesson_uuid = parse_uuid(lesson_id)
+        if lesson_uuid is None:
+            return Response({'error': 'Lesson not found'}, status=status.HTTP_404_NOT_FOUND)
         try:
-            lesson = Lesson.objects.get(id=lesson_id)
+            lesson = Lesson.objects.get(id=lesson_uuid)
         except Lesson.DoesNotExist:
             return Response({'error': 'Lesson not found'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -1924,8 +1940,10 @@ class DiagnosticSubmitView(APIView):
         performance = {}
         
         for answer in answers:
-            question_id = answer.get('question_id')
+            question_id = parse_uuid(answer.get('question_id'))
             is_correct = answer.get('is_correct', False)
+            if question_id is None:
+                continue
             
             try:
                 question = LessonQuestion.objects.get(id=question_id)
@@ -2031,10 +2049,13 @@ class SubmitLessonView(APIView):
         if not answers:
             return Response({'error': 'No answers provided'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Get all questions for this lesson to determine total count
-        all_questions = lesson.questions.all().order_by('order')
-        total_questions_in_lesson = all_questions.count()
-        question_dict = {str(q.id): q for q in all_questions}
+        # Only the scoring column, as plain dicts keyed by the id string answers carry;
+        # one query gives both the lookup and the total count
+        question_dict = {
+            str(row['id']): row
+            for row in lesson.questions.order_by().values('id', 'correct_answer_index')
+        }
+        total_questions_in_lesson = len(question_dict)
         
         # Check if there's an in-progress attempt for this user+lesson
         # Look for the most recent attempt that might be in progress
@@ -2064,12 +2085,12 @@ class SubmitLessonView(APIView):
                 
                 try:
                     question = question_dict[question_id]
-                    is_correct = selected_index == question.correct_answer_index
+                    is_correct = selected_index == question['correct_answer_index']
                     
                     processed_answer = {
                         'question_id': question_id,
                         'selected_option_index': selected_index,
-                        'correct_answer_index': question.correct_answer_index,
+                        'correct_answer_index': question['correct_answer_index'],
                         'is_correct': is_correct,
                     }
                     existing_answers[question_id] = processed_answer
@@ -2091,12 +2112,12 @@ class SubmitLessonView(APIView):
                 
                 try:
                     question = question_dict[question_id]
-                    is_correct = selected_index == question.correct_answer_index
+                    is_correct = selected_index == question['correct_answer_index']
                     
                     processed_answers.append({
                         'question_id': question_id,
                         'selected_option_index': selected_index,
-                        'correct_answer_index': question.correct_answer_index,
+                        'correct_answer_index': question['correct_answer_index'],
                         'is_correct': is_correct,
                     })
                 except (KeyError, LessonQuestion.DoesNotExist):
@@ -2197,8 +2218,10 @@ class SubmitLessonView(APIView):
         performance = {}
         
         for answer in answers:
-            question_id = answer.get('question_id')
+            question_id = parse_uuid(answer.get('question_id'))
             is_correct = answer.get('is_correct', False)
+            if question_id is None:
+                continue
             
             try:
                 question = LessonQuestion.objects.get(id=question_id)
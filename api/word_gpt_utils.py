@@ -0,0 +1,661 @@
+"""
+Utilities for generating the SAT word of the day using GPT.
+
+Location: api/word_gpt_utils.py
+Summary: generate_word() asks OpenAI for one SAT vocabulary word, caching the parsed
+         result so the same request isn't billed twice, and falls back to a curated word.
+         generate_words() requests several words concurrently with AsyncOpenAI;
+         submit_word_batch()/collect_word_batch() do the same through the Batch API.
+         Spare words are banked in VocabWord (bank_words/take_banked_word) for later days.
+Usage: api/views.py: WordOfTheDayView;
+       api/management/commands/generate_words_of_the_day.py
+"""
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import random
+import re
+import time
+from datetime import date
+from functools import lru_cache
+
+import orjson
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.functions import Lower, Trim
+
+from .models import VocabWord, WordOfTheDay
+
+logger = logging.getLogger(__name__)
+
+# Overridable with the OPENAI_WORD_MODEL env var (e.g. to roll back to gpt-3.5-turbo)
+WORD_MODEL = settings.OPENAI_WORD_MODEL
+# Completion cap per word; a record is well under 100 tokens, so this only bounds a
+# runaway reply. Tune it from the completion_tokens logged by record_usage()
+WORD_MAX_TOKENS = settings.OPENAI_WORD_MAX_TOKENS
+WORD_TEMPERATURE = 0.7
+WORD_GENERATION_CACHE_TIMEOUT = 60 * 60
+# Completions requested per call (the n parameter) when generating several words
+WORD_CHOICES_PER_REQUEST = 10
+# Attempts per completion on rate limits, timeouts, connection errors and 5xx, with
+# full-jitter exponential backoff between them (at most 1s, 2s, 4s, ... capped at the max)
+WORD_RETRY_ATTEMPTS = 4
+WORD_RETRY_BASE_DELAY = 1.0
+WORD_RETRY_MAX_DELAY = 8.0
+# generate_word() runs inside a web request (WordOfTheDayView), which must finish well
+# within gunicorn's 30s worker timeout and the view's 30s generation lock: two short
+# attempts there (at most 8s + 1s + 8s); the full retry budget is for the command
+WORD_REQUEST_ATTEMPTS = 2
+WORD_REQUEST_TIMEOUT = 8.0
+# Pacing for concurrent generation (generate_words): requests in flight, and
+# per-minute request and token budgets kept under the account's RPM/TPM limits
+WORD_MAX_CONCURRENT_REQUESTS = 5
+WORD_REQUESTS_PER_MINUTE = 300
+WORD_TOKENS_PER_MINUTE = 100_000
+
+WORD_SYSTEM_PROMPT = "You are a helpful assistant that generates SAT vocabulary words in JSON format."
+# Request pieces that never change, built once and shared by every call
+WORD_SYSTEM_MESSAGE = {"role": "system", "content": WORD_SYSTEM_PROMPT}
+# JSON mode: the reply is always a parseable object (the system prompt must mention JSON)
+WORD_RESPONSE_FORMAT = {'type': 'json_object'}
+WORD_PROMPT = """Generate a SAT-level vocabulary word with the following format (return as JSON):
+{
+  "word": "the vocabulary word",
+  "definition": "a clear, concise definition suitable for SAT prep",
+  "synonyms": ["synonym1", "synonym2", "synonym3", "synonym4"],
+  "example_sentence": "a sentence demonstrating the word's usage in context"
+}
+
+Choose a word that is:
+- Appropriate for SAT vocabulary level (not too easy, not too obscure)
+- Useful for academic reading comprehension
+- Can be clearly defined and has good synonyms
+
+Return ONLY valid JSON, no other text."""
+
+REQUIRED_FIELDS = frozenset(('word', 'definition', 'synonyms', 'example_sentence'))
+# Splits a comma-joined synonym string and trims around each comma in one pass
+SYNONYM_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Curated words served when generation isn't possible, rotated by date (see get_fallback_word)
+FALLBACK_WORDS = (
+    {'word': 'Eloquent', 'definition': 'Fluent or persuasive in speaking or writing.',
+     'synonyms': ['Articulate', 'Fluent', 'Expressive', 'Well-spoken'],
+     'example_sentence': 'The eloquent speaker captivated the audience with her powerful words.'},
+    {'word': 'Ambivalent', 'definition': 'Having mixed or contradictory feelings about something.',
+     'synonyms': ['Uncertain', 'Conflicted', 'Torn', 'Undecided'],
+     'example_sentence': 'She felt ambivalent about moving, excited by the new city but sad to leave her friends.'},
+    {'word': 'Benevolent', 'definition': 'Well-meaning and kindly; disposed to do good.',
+     'synonyms': ['Kind', 'Charitable', 'Generous', 'Compassionate'],
+     'example_sentence': 'The benevolent donor funded scholarships for every student in the program.'},
+    {'word': 'Candid', 'definition': 'Truthful and straightforward; frank.',
+     'synonyms': ['Frank', 'Honest', 'Direct', 'Forthright'],
+     'example_sentence': 'His candid review pointed out both the strengths and the flaws of the plan.'},
+    {'word': 'Diligent', 'definition': 'Showing care and steady effort in one\'s work or duties.',
+     'synonyms': ['Industrious', 'Hardworking', 'Conscientious', 'Assiduous'],
+     'example_sentence': 'A diligent student, he reviewed his notes every evening.'},
+    {'word': 'Ephemeral', 'definition': 'Lasting for a very short time.',
+     'synonyms': ['Fleeting', 'Transient', 'Brief', 'Momentary'],
+     'example_sentence': 'The beauty of the cherry blossoms is ephemeral, lasting only a week or two.'},
+    {'word': 'Frugal', 'definition': 'Careful and economical with money or resources.',
+     'synonyms': ['Thrifty', 'Economical', 'Sparing', 'Prudent'],
+     'example_sentence': 'Her frugal habits allowed her to save enough for college.'},
+    {'word': 'Gregarious', 'definition': 'Fond of company; sociable.',
+     'synonyms': ['Sociable', 'Outgoing', 'Convivial', 'Friendly'],
+     'example_sentence': 'The gregarious new student made friends on his very first day.'},
+    {'word': 'Hackneyed', 'definition': 'Lacking originality because of overuse.',
+     'synonyms': ['Clichéd', 'Trite', 'Stale', 'Overused'],
+     'example_sentence': 'The essay relied on hackneyed phrases instead of fresh ideas.'},
+    {'word': 'Impartial', 'definition': 'Treating all sides equally; fair and unbiased.',
+     'synonyms': ['Unbiased', 'Neutral', 'Objective', 'Even-handed'],
+     'example_sentence': 'The judge remained impartial throughout the heated trial.'},
+    {'word': 'Juxtapose', 'definition': 'To place side by side for contrast or comparison.',
+     'synonyms': ['Contrast', 'Compare', 'Pair', 'Set against'],
+     'example_sentence': 'The exhibit juxtaposes modern sculptures with ancient artifacts.'},
+    {'word': 'Laconic', 'definition': 'Using very few words.',
+     'synonyms': ['Terse', 'Concise', 'Succinct', 'Brief'],
+     'example_sentence': 'His laconic reply of "fine" told us little about his day.'},
+    {'word': 'Meticulous', 'definition': 'Showing great attention to detail; very careful and precise.',
+     'synonyms': ['Thorough', 'Painstaking', 'Scrupulous', 'Precise'],
+     'example_sentence': 'The meticulous editor caught every misplaced comma.'},
+    {'word': 'Nonchalant', 'definition': 'Appearing casually calm and unconcerned.',
+     'synonyms': ['Casual', 'Unconcerned', 'Indifferent', 'Composed'],
+     'example_sentence': 'He gave a nonchalant shrug, though he was nervous inside.'},
+    {'word': 'Obstinate', 'definition': 'Stubbornly refusing to change one\'s opinion or course of action.',
+     'synonyms': ['Stubborn', 'Inflexible', 'Headstrong', 'Unyielding'],
+     'example_sentence': 'The obstinate mule refused to cross the bridge.'},
+    {'word': 'Pragmatic', 'definition': 'Dealing with things sensibly and realistically.',
+     'synonyms': ['Practical', 'Realistic', 'Sensible', 'Level-headed'],
+     'example_sentence': 'The council took a pragmatic approach and fixed the cheapest problems first.'},
+    {'word': 'Quell', 'definition': 'To put an end to, typically by force; to calm or suppress.',
+     'synonyms': ['Suppress', 'Subdue', 'Calm', 'Quash'],
+     'example_sentence': 'The coach tried to quell the team\'s nerves before the final.'},
+    {'word': 'Resilient', 'definition': 'Able to recover quickly from difficulties.',
+     'synonyms': ['Tough', 'Hardy', 'Adaptable', 'Buoyant'],
+     'example_sentence': 'The resilient community rebuilt quickly after the flood.'},
+    {'word': 'Scrutinize', 'definition': 'To examine closely and thoroughly.',
+     'synonyms': ['Examine', 'Inspect', 'Analyze', 'Study'],
+     'example_sentence': 'Investors scrutinized the company\'s financial reports.'},
+    {'word': 'Tenacious', 'definition': 'Holding firmly to a purpose; persistent.',
+     'synonyms': ['Persistent', 'Determined', 'Dogged', 'Steadfast'],
+     'example_sentence': 'The tenacious reporter kept digging until she found the truth.'},
+    {'word': 'Ubiquitous', 'definition': 'Present, appearing, or found everywhere.',
+     'synonyms': ['Omnipresent', 'Pervasive', 'Universal', 'Widespread'],
+     'example_sentence': 'Smartphones have become ubiquitous in modern life.'},
+    {'word': 'Venerate', 'definition': 'To regard with great respect.',
+     'synonyms': ['Revere', 'Honor', 'Esteem', 'Respect'],
+     'example_sentence': 'The villagers venerate the elders for their wisdom.'},
+    {'word': 'Wary', 'definition': 'Feeling or showing caution about possible dangers or problems.',
+     'synonyms': ['Cautious', 'Careful', 'Guarded', 'Vigilant'],
+     'example_sentence': 'Hikers should be wary of sudden changes in the weather.'},
+    {'word': 'Zealous', 'definition': 'Having or showing great energy or enthusiasm for a cause.',
+     'synonyms': ['Fervent', 'Passionate', 'Ardent', 'Devoted'],
+     'example_sentence': 'The zealous volunteers worked through the night.'},
+    {'word': 'Abate', 'definition': 'To become less intense or widespread.',
+     'synonyms': ['Subside', 'Diminish', 'Wane', 'Lessen'],
+     'example_sentence': 'We waited for the storm to abate before heading out.'},
+    {'word': 'Cogent', 'definition': 'Clear, logical, and convincing.',
+     'synonyms': ['Convincing', 'Compelling', 'Persuasive', 'Sound'],
+     'example_sentence': 'She presented a cogent argument for extending the library hours.'},
+    {'word': 'Disparate', 'definition': 'Essentially different in kind; not able to be compared.',
+     'synonyms': ['Different', 'Dissimilar', 'Distinct', 'Divergent'],
+     'example_sentence': 'The club brought together students from disparate backgrounds.'},
+    {'word': 'Enigmatic', 'definition': 'Difficult to interpret or understand; mysterious.',
+     'synonyms': ['Mysterious', 'Puzzling', 'Cryptic', 'Inscrutable'],
+     'example_sentence': 'The painting is famous for its subject\'s enigmatic smile.'},
+    {'word': 'Fortuitous', 'definition': 'Happening by chance, especially in a lucky way.',
+     'synonyms': ['Lucky', 'Chance', 'Accidental', 'Serendipitous'],
+     'example_sentence': 'A fortuitous meeting at the airport led to her first job offer.'},
+    {'word': 'Innocuous', 'definition': 'Not harmful or offensive.',
+     'synonyms': ['Harmless', 'Inoffensive', 'Benign', 'Safe'],
+     'example_sentence': 'What seemed like an innocuous question started a long debate.'},
+    {'word': 'Lucid', 'definition': 'Expressed clearly; easy to understand.',
+     'synonyms': ['Clear', 'Coherent', 'Intelligible', 'Transparent'],
+     'example_sentence': 'The textbook gives a lucid explanation of photosynthesis.'},
+    {'word': 'Mitigate', 'definition': 'To make less severe, serious, or painful.',
+     'synonyms': ['Alleviate', 'Reduce', 'Ease', 'Lessen'],
+     'example_sentence': 'Planting trees can help mitigate the effects of urban heat.'},
+    {'word': 'Placate', 'definition': 'To make someone less angry or hostile.',
+     'synonyms': ['Appease', 'Pacify', 'Soothe', 'Mollify'],
+     'example_sentence': 'The manager offered a refund to placate the upset customer.'},
+    {'word': 'Prolific', 'definition': 'Producing much work or many results.',
+     'synonyms': ['Productive', 'Fruitful', 'Abundant', 'Fertile'],
+     'example_sentence': 'The prolific author published three novels in a single year.'},
+    {'word': 'Reticent', 'definition': 'Not revealing one\'s thoughts or feelings readily.',
+     'synonyms': ['Reserved', 'Restrained', 'Quiet', 'Taciturn'],
+     'example_sentence': 'He was reticent about his plans for the summer.'},
+    {'word': 'Sagacious', 'definition': 'Having or showing keen judgment; wise.',
+     'synonyms': ['Wise', 'Shrewd', 'Astute', 'Perceptive'],
+     'example_sentence': 'The sagacious mentor knew exactly when to offer advice.'},
+    {'word': 'Superfluous', 'definition': 'Unnecessary, especially through being more than enough.',
+     'synonyms': ['Unnecessary', 'Excess', 'Redundant', 'Extra'],
+     'example_sentence': 'The editor cut every superfluous word from the article.'},
+    {'word': 'Undermine', 'definition': 'To weaken or damage something, often gradually.',
+     'synonyms': ['Weaken', 'Erode', 'Sabotage', 'Subvert'],
+     'example_sentence': 'Constant criticism can undermine a person\'s confidence.'},
+    {'word': 'Vindicate', 'definition': 'To clear of blame or suspicion; to show to be right.',
+     'synonyms': ['Exonerate', 'Justify', 'Absolve', 'Support'],
+     'example_sentence': 'The new evidence vindicated the scientist\'s controversial theory.'},
+    {'word': 'Wane', 'definition': 'To decrease gradually in size, strength, or importance.',
+     'synonyms': ['Decline', 'Fade', 'Diminish', 'Ebb'],
+     'example_sentence': 'Interest in the fad began to wane after a few months.'},
+)
+
+# Hit/miss counters for the generation cache (per process)
+generation_cache_stats = {'hits': 0, 'misses': 0}
+# Token usage of completed calls (per process); max_completion_tokens is the
+# largest single reply seen, to compare against WORD_MAX_TOKENS
+generation_usage_stats = {'calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'max_completion_tokens': 0}
+# Generated words dropped as repeats of a known word (per process)
+generation_dedupe_stats = {'duplicates': 0}
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key):
+    """
+    Process-wide OpenAI client for api_key.
+
+    Reusing one client keeps its HTTP connection pool (and the TLS sessions in
+    it) alive between requests instead of reconnecting on every generation.
+    The SDK's own retries are off; create_completion() does the retrying.
+    """
+    from openai import OpenAI, Timeout
+    return OpenAI(api_key=api_key, timeout=Timeout(30.0, connect=5.0), max_retries=0)
+
+
+def get_retry_delay(attempt):
+    """Seconds to wait before retrying after the given (0-based) failed attempt"""
+    return random.uniform(0, min(WORD_RETRY_MAX_DELAY, WORD_RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def record_usage(response):
+    """Log a completion's token usage and add it to generation_usage_stats"""
+    usage = response.get('usage') or {}
+    prompt_tokens = usage.get('prompt_tokens', 0)
+    completion_tokens = usage.get('completion_tokens', 0)
+    # With n > 1 the completion tokens cover every choice
+    per_choice = completion_tokens // max(len(response.get('choices') or ()), 1)
+    generation_usage_stats['calls'] += 1
+    generation_usage_stats['prompt_tokens'] += prompt_tokens
+    generation_usage_stats['completion_tokens'] += completion_tokens
+    generation_usage_stats['max_completion_tokens'] = max(generation_usage_stats['max_completion_tokens'], per_choice)
+    logger.info(
+        f"Word generation usage: prompt_tokens={prompt_tokens} completion_tokens={completion_tokens} "
+        f"per_choice={per_choice} max_tokens={WORD_MAX_TOKENS}"
+    )
+
+
+def create_completion(client, attempts=WORD_RETRY_ATTEMPTS, **kwargs):
+    """
+    client.chat.completions.create(), tried up to attempts times with backoff on
+    transient errors.
+
+    Returns the decoded response body as a plain dict: the raw bytes go
+    straight to orjson instead of being validated into the SDK's pydantic
+    models, since only choices[i]['message']['content'] is read.
+    """
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    for attempt in range(attempts):
+        try:
+            response = orjson.loads(client.chat.completions.with_raw_response.create(**kwargs).content)
+            record_usage(response)
+            return response
+        except (RateLimitError, APIConnectionError, InternalServerError) as e:
+            if attempt == attempts - 1:
+                raise
+            delay = get_retry_delay(attempt)
+            logger.warning(f"Word generation attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+async def acreate_completion(client, **kwargs):
+    """Async create_completion() for AsyncOpenAI clients"""
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    for attempt in range(WORD_RETRY_ATTEMPTS):
+        try:
+            response = orjson.loads((await client.chat.completions.with_raw_response.create(**kwargs)).content)
+            record_usage(response)
+            return response
+        except (RateLimitError, APIConnectionError, InternalServerError) as e:
+            if attempt == WORD_RETRY_ATTEMPTS - 1:
+                raise
+            delay = get_retry_delay(attempt)
+            logger.warning(f"Word generation attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def get_generation_cache_key(model, prompt, temperature, for_date):
+    """
+    Cache key for one generation request.
+
+    The date is part of the key so a cached word is never served as the next
+    day's word; within a day, the same model/prompt/temperature reuses it.
+    """
+    payload = json.dumps({'m': model, 'p': prompt, 't': temperature, 'd': for_date.isoformat()}, sort_keys=True)
+    return 'wotd:gen:%s' % hashlib.sha256(payload.encode()).hexdigest()
+
+
+def parse_word(content):
+    """Parse a completion into word data, or return None if it isn't a complete word"""
+    # JSON mode (see get_completion_kwargs) returns a bare object, no markdown fences
+    word_data = orjson.loads(content)
+
+    # Validate required fields
+    if not isinstance(word_data, dict) or not REQUIRED_FIELDS.issubset(word_data):
+        return None
+    # Ensure synonyms is a list
+    if isinstance(word_data['synonyms'], str):
+        word_data['synonyms'] = [s for s in SYNONYM_SPLIT_RE.split(word_data['synonyms'].strip()) if s]
+    return word_data
+
+
+def get_fallback_word(for_date=None):
+    """
+    The curated word to serve for for_date (default today) when generation fails,
+    or None once every curated word has been used.
+
+    The list is rotated by date so outages don't keep serving one entry. Entries
+    that are already a day's word or banked are skipped: the unique
+    WordOfTheDay.word column would reject them, so the next unused entry
+    (wrapping around the rotation) is returned instead.
+    """
+    for_date = for_date or date.today()
+    start = for_date.toordinal() % len(FALLBACK_WORDS)
+    known = get_known_words(FALLBACK_WORDS)
+    for word_data in FALLBACK_WORDS[start:] + FALLBACK_WORDS[:start]:
+        if normalize_word(word_data['word']) not in known:
+            return dict(word_data)
+    return None
+
+
+def normalize_word(word):
+    """Comparison form of a word: generations of the same word differ in case and stray spaces"""
+    return word.strip().lower()
+
+
+def normalized_words(queryset):
+    """queryset annotated with normalized_word, the SQL equivalent of normalize_word()"""
+    return queryset.annotate(normalized_word=Lower(Trim('word')))
+
+
+def get_known_words(words):
+    """Normalized forms of the given word dicts that are already a day's word or banked"""
+    keys = {normalize_word(w['word']) for w in words}
+    known = set()
+    for model in (WordOfTheDay, VocabWord):
+        known.update(
+            normalized_words(model.objects).filter(normalized_word__in=keys).values_list('normalized_word', flat=True)
+        )
+    return known
+
+
+def dedupe_words(words, known):
+    """
+    The word dicts whose normalized word isn't in known or earlier in words.
+
+    The unique word columns only catch exact repeats, so without this
+    'Laconic' and 'laconic ' would both be stored. known is updated in place.
+    """
+    fresh = []
+    for word_data in words:
+        key = normalize_word(word_data['word'])
+        if key in known:
+            generation_dedupe_stats['duplicates'] += 1
+            continue
+        known.add(key)
+        fresh.append(word_data)
+    return fresh
+
+
+def bank_words(words):
+    """Store generated words that weren't used for any day, skipping known words"""
+    VocabWord.objects.bulk_create(
+        [
+            VocabWord(
+                word=w['word'],
+                definition=w['definition'],
+                synonyms=w['synonyms'],
+                example_sentence=w['example_sentence'],
+            )
+            for w in dedupe_words(words, get_known_words(words))
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def get_unused_banked_words():
+    """Banked words that haven't since been used for a day"""
+    return normalized_words(VocabWord.objects).exclude(
+        normalized_word__in=normalized_words(WordOfTheDay.objects).values('normalized_word')
+    )
+
+
+def count_banked_words():
+    """Number of banked words still available to take_banked_word()"""
+    return get_unused_banked_words().count()
+
+
+def take_banked_word(day):
+    """
+    Make the oldest banked word the word of the day for day, or return None if
+    the bank is empty.
+
+    Served ahead of a live generation: a DB read instead of an OpenAI round
+    trip. Words that have since been used for a day are skipped. The banked row
+    is deleted in the same transaction as the WordOfTheDay insert, and only if
+    that insert created the day's row; when another request got there first its
+    word is returned and the banked word stays for a later day.
+    """
+    with transaction.atomic():
+        banked = get_unused_banked_words().order_by('created_at').first()
+        if banked is None:
+            return None
+        word_of_day, created = WordOfTheDay.objects.get_or_create(
+            date=day,
+            defaults={
+                'word': banked.word,
+                'definition': banked.definition,
+                'synonyms': banked.synonyms,
+                'example_sentence': banked.example_sentence,
+            },
+        )
+        if created:
+            banked.delete()
+    return word_of_day
+
+
+def get_completion_kwargs(model, prompt, temperature):
+    """chat.completions.create() arguments shared by the sync and async paths"""
+    return {
+        'model': model,
+        'messages': [WORD_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+        'temperature': temperature,
+        'max_tokens': WORD_MAX_TOKENS,
+        'response_format': WORD_RESPONSE_FORMAT,
+    }
+
+
+def generate_word(model=WORD_MODEL, prompt=WORD_PROMPT, temperature=WORD_TEMPERATURE):
+    """
+    Generate a SAT vocabulary word with OpenAI.
+
+    Returns:
+        dict: word, definition, synonyms and example_sentence. Today's
+        get_fallback_word() is returned when no API key is configured, the
+        call/parse fails or the word repeats a past or banked word (None if
+        every fallback word has been used too). Only new words are cached.
+    """
+    api_key = settings.OPENAI_API_KEY
+    if not api_key:
+        return get_fallback_word()
+
+    cache_key = get_generation_cache_key(model, prompt, temperature, date.today())
+    word_data = cache.get(cache_key)
+    if word_data is not None:
+        generation_cache_stats['hits'] += 1
+        return word_data
+    generation_cache_stats['misses'] += 1
+
+    from openai import OpenAIError, Timeout
+
+    # Request path: a short timeout and WORD_REQUEST_ATTEMPTS, then the fallback word
+    client = get_openai_client(api_key).with_options(timeout=Timeout(WORD_REQUEST_TIMEOUT, connect=3.0))
+    try:
+        response = create_completion(
+            client, attempts=WORD_REQUEST_ATTEMPTS, **get_completion_kwargs(model, prompt, temperature)
+        )
+        word_data = parse_word(response['choices'][0]['message']['content'])
+    except (OpenAIError, KeyError, IndexError, TypeError, ValueError) as e:
+        # Retries are exhausted or the reply is unusable
+        logger.warning(f"Word generation failed, using the fallback word: {e}")
+        return get_fallback_word()
+
+    if word_data is None:
+        # Failures aren't cached so the next request tries again
+        logger.warning("Word generation returned an incomplete word, using the fallback word")
+        return get_fallback_word()
+
+    if not dedupe_words([word_data], get_known_words([word_data])):
+        # A repeat would fail the unique WordOfTheDay.word insert; not cached either,
+        # so the next request asks for a new word instead of replaying this one
+        logger.warning(f"Word generation repeated a known word ({word_data['word']}), using the fallback word")
+        return get_fallback_word()
+
+    cache.set(cache_key, word_data, WORD_GENERATION_CACHE_TIMEOUT)
+    return word_data
+
+
+class TokenBucket:
+    """
+    Per-minute allowance for pacing async OpenAI calls, refilled continuously.
+
+    acquire() waits until the requested amount has accrued, so a burst of
+    gathered calls is spread out instead of tripping 429s and spending the
+    retry budget. Waiters are served in order.
+    """
+
+    def __init__(self, per_minute):
+        self.capacity = per_minute
+        self.available = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, amount=1):
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((amount - self.available) / self.rate)
+
+
+def estimate_tokens(prompt, n):
+    """Rough tokens billed against TPM for one call: ~4 characters per prompt token plus the reply cap per choice"""
+    return (len(WORD_SYSTEM_PROMPT) + len(prompt)) // 4 + WORD_MAX_TOKENS * n
+
+
+async def _agenerate_words(api_key, count, model, prompt, temperature):
+    from openai import AsyncOpenAI, Timeout
+
+    # Created per run: asyncio primitives belong to the event loop that uses them
+    in_flight = asyncio.Semaphore(WORD_MAX_CONCURRENT_REQUESTS)
+    requests_bucket = TokenBucket(WORD_REQUESTS_PER_MINUTE)
+    tokens_bucket = TokenBucket(WORD_TOKENS_PER_MINUTE)
+
+    async def generate_choices(client, n):
+        async with in_flight:
+            await requests_bucket.acquire()
+            await tokens_bucket.acquire(estimate_tokens(prompt, n))
+            response = await acreate_completion(client, **get_completion_kwargs(model, prompt, temperature), n=n)
+        words = []
+        for choice in response['choices']:
+            try:
+                words.append(parse_word(choice['message']['content']))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return words
+
+    sizes = [min(WORD_CHOICES_PER_REQUEST, count - i) for i in range(0, count, WORD_CHOICES_PER_REQUEST)]
+    # An async client's connections belong to the event loop that opened them, so
+    # each asyncio.run() gets its own client, shared by every request it gathers
+    async with AsyncOpenAI(api_key=api_key, timeout=Timeout(30.0, connect=5.0), max_retries=0) as client:
+        return await asyncio.gather(*(generate_choices(client, n) for n in sizes), return_exceptions=True)
+
+
+def generate_words(count, model=WORD_MODEL, prompt=WORD_PROMPT, temperature=WORD_TEMPERATURE):
+    """
+    Generate up to count distinct SAT vocabulary words.
+
+    Each request asks for up to WORD_CHOICES_PER_REQUEST completions with the
+    n parameter, so the prompt is sent (and billed) once per request rather
+    than once per word, and the requests share one AsyncOpenAI client and run
+    concurrently. Failed or unparseable generations and repeated words are
+    dropped rather than replaced with a fallback word, and results bypass the
+    generation cache since each call should be a new word.
+
+    Returns:
+        list: word dicts, possibly fewer than count
+
+    Raises:
+        Exception: If the OpenAI API key is not configured
+    """
+    api_key = settings.OPENAI_API_KEY
+    if not api_key:
+        raise Exception("OpenAI API key not configured")
+
+    results = asyncio.run(_agenerate_words(api_key, count, model, prompt, temperature))
+    words = [
+        word_data
+        for result in results if not isinstance(result, Exception)
+        for word_data in result if word_data
+    ]
+    return dedupe_words(words, set())
+
+
+def submit_word_batch(count, model=WORD_MODEL, prompt=WORD_PROMPT, temperature=WORD_TEMPERATURE):
+    """
+    Submit count word generations as one OpenAI Batch API job.
+
+    Batch jobs are billed at half the synchronous rate and don't count against
+    the per-minute limits, at the cost of finishing within 24 hours instead
+    of seconds, so they suit building up words well ahead of their dates.
+
+    Returns:
+        str: the batch id, to pass to collect_word_batch() later
+
+    Raises:
+        Exception: If the OpenAI API key is not configured
+    """
+    api_key = settings.OPENAI_API_KEY
+    if not api_key:
+        raise Exception("OpenAI API key not configured")
+
+    # Batch calls aren't wrapped in create_completion(), so let the SDK retry them
+    client = get_openai_client(api_key).with_options(max_retries=2)
+
+    body = get_completion_kwargs(model, prompt, temperature)
+    jsonl = ''.join(
+        json.dumps({'custom_id': f'w{i}', 'method': 'POST', 'url': '/v1/chat/completions', 'body': body}) + '\n'
+        for i in range(count)
+    )
+    batch_file = client.files.create(file=('words.jsonl', io.BytesIO(jsonl.encode())), purpose='batch')
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint='/v1/chat/completions',
+        completion_window='24h',
+    )
+    return batch.id
+
+
+def collect_word_batch(batch_id):
+    """
+    Fetch the words generated by a batch submitted with submit_word_batch().
+
+    Returns:
+        list | None: word dicts from the successful requests, or None while the
+        batch is still running
+
+    Raises:
+        Exception: If the API key is missing or the batch failed, expired or was cancelled
+    """
+    api_key = settings.OPENAI_API_KEY
+    if not api_key:
+        raise Exception("OpenAI API key not configured")
+
+    # Batch calls aren't wrapped in create_completion(), so let the SDK retry them
+    client = get_openai_client(api_key).with_options(max_retries=2)
+
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in ('failed', 'expired', 'cancelled'):
+        raise Exception(f"Batch {batch_id} {batch.status}")
+    if batch.status != 'completed':
+        return None
+    if not batch.output_file_id:
+        return []
+
+    words = []
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line:
+            continue
+        result = orjson.loads(line)
+        response = result.get('response') or {}
+        if response.get('status_code') != 200:
+            continue
+        try:
+            word_data = parse_word(response['body']['choices'][0]['message']['content'])
+        except (KeyError, IndexError, TypeError, ValueError):
+            continue
+        if word_data:
+            words.append(word_data)
+    return words
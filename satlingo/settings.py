@@ -170,13 +170,13 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 50,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'api.parsers.ORJSONParser',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.PremiumJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -186,7 +186,7 @@ REST_FRAMEWORK = {
 
 # Disable CSRF for API views (DRF handles this, but ensure it's explicit)
 REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] = [
-    'rest_framework_simplejwt.authentication.JWTAuthentication',
+    'api.authentication.PremiumJWTAuthentication',
 ]
 
 # CORS settings
@@ -217,6 +217,8 @@ PREMIUM_MONTHLY_PRICE = 50.00  # $50 per month
 
 # OpenAI Settings
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
+OPENAI_WORD_MODEL = os.environ.get('OPENAI_WORD_MODEL', 'gpt-4o-mini')  # Word of the day generation
+OPENAI_WORD_MAX_TOKENS = int(os.environ.get('OPENAI_WORD_MAX_TOKENS', '150'))  # Tune from logged completion_tokens
 
 # AWS S3 Settings for diagram storage (used when USE_GCS is False; keep during migration)
 AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID', '')
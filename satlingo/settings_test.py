@@ -0,0 +1,22 @@
+"""
+Django test settings for satlingo project.
+
+Runs the test suite against an in-memory SQLite database so tests never
+touch (or wait on) the Postgres instance configured via DATABASE_URL.
+
+Usage: python manage.py test --settings=satlingo.settings_test
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Password hashing is deliberately slow; tests only need it to round-trip
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]